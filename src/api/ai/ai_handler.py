@@ -4,16 +4,26 @@ AI caption generation handler for Breadsmith Marketing Tool.
 import logging
 import uuid
 import os
-import base64
-from typing import Dict, Any, Optional, List, Tuple
+import io
+import re
+import json
+import copy
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Callable
 import random
-from PIL import Image, ImageStat, ImageFilter
+import time
+import cv2
+import numpy as np
+from PIL import Image, ImageOps, ImageStat, ImageFilter
 import google.generativeai as genai
 from dotenv import load_dotenv
 
 from ...config import constants as const
 from ...models.app_state import AppState
 from ...utils.file_reader import extract_context_from_files
+from ...utils.jpeg_encoder import encode_jpeg
 
 # Load API key from environment variables or use shared key
 load_dotenv()
@@ -27,6 +37,100 @@ if GEMINI_API_KEY:
 GEMINI_VISION_MODEL = "gemini-1.5-flash"  # For image analysis
 GEMINI_TEXT_MODEL = "gemini-1.5-flash"    # For text generation
 
+# Gemini resizes images to roughly 768px internally, so anything larger only
+# costs encode time, upload bandwidth and per-pixel API pricing
+GEMINI_MAX_IMAGE_DIMENSION = 768
+GEMINI_JPEG_QUALITY = 80
+
+# EXIF tag holding how the camera was rotated; 1 means the pixels are upright
+EXIF_ORIENTATION_TAG = 0x0112
+
+# Upper bound on Gemini vision requests in flight at once for a single video
+GEMINI_MAX_CONCURRENT_REQUESTS = 4
+
+# Key frames flatter than this (black/fade transitions) carry nothing worth
+# sending to Gemini
+MIN_FRAME_STDDEV = 8.0
+
+# Motion scoring only needs one scalar per frame pair, so frames are shrunk to
+# this (width, height) before differencing
+MOTION_FRAME_SIZE = (128, 72)
+
+# Video analyses are memoized per handler, keyed by a fingerprint of the file's
+# first bytes, size and modification time, so re-captioning the same video
+# skips frame extraction and the Gemini calls
+VIDEO_ANALYSIS_CACHE_SIZE = 16
+FINGERPRINT_HEAD_BYTES = 64 * 1024
+
+# Key frames of one video whose difference hashes differ in at most this many
+# bits are treated as the same picture and share a single analysis
+FRAME_HASH_MAX_DISTANCE = 4
+
+# Keyword vocabularies used by the offline sample caption generator
+SAMPLE_BUSINESS_TYPES = [
+    "bakery", "restaurant", "cafe", "boutique", "salon", "fitness", 
+    "yoga", "retail", "photography", "art", "craft", "jewelry", 
+    "clothing", "travel", "hotel", "pet", "realty", "tech"
+]
+
+SAMPLE_TONE_TYPES = [
+    "professional", "casual", "luxury", "budget-friendly", "artisan", 
+    "handcrafted", "traditional", "modern", "vintage", "sustainable", 
+    "organic", "vegan", "local", "family-owned", "premium", "customized"
+]
+
+SAMPLE_SEASONAL_KEYWORDS = ["summer", "spring", "fall", "winter", "holiday", "special", "new", "sale"]
+
+# Zero-width lookaheads so every position is tested, matching the semantics of
+# a substring check per keyword while scanning the text only once
+_BUSINESS_TYPES_RE = re.compile("(?=(" + "|".join(map(re.escape, SAMPLE_BUSINESS_TYPES)) + "))")
+_TONE_TYPES_RE = re.compile("(?=(" + "|".join(map(re.escape, SAMPLE_TONE_TYPES)) + "))")
+_SEASONAL_KEYWORDS_RE = re.compile("(?=(" + "|".join(map(re.escape, SAMPLE_SEASONAL_KEYWORDS)) + "))")
+
+# Prompt Gemini to analyze the image content, not the technical aspects
+CONTENT_ANALYSIS_PROMPT = """
+            Analyze this image and identify:
+            1. Main subject matter (what/who is in the image)
+            2. Setting or environment
+            3. Activities or actions shown
+            4. Mood or feeling conveyed
+            5. Any themes or concepts represented
+            6. Any distinctive visual elements
+            
+            Focus ONLY on what's actually in the image, not how it was created or edited.
+            Format your response as a JSON with these keys: main_subject, setting, activities, mood, themes, distinctive_elements
+            """
+
+# Same analysis for several video frames in one request; formatted with the frame count
+BATCH_CONTENT_ANALYSIS_PROMPT = """
+            You are given {count} images, frames sampled in order from the same video.
+            For EACH image, identify:
+            1. Main subject matter (what/who is in the image)
+            2. Setting or environment
+            3. Activities or actions shown
+            4. Mood or feeling conveyed
+            5. Any themes or concepts represented
+            6. Any distinctive visual elements
+            
+            Focus ONLY on what's actually in the images, not how they were created or edited.
+            Format your response as a JSON array of exactly {count} objects, one per image in the order given,
+            each with these keys: main_subject, setting, activities, mood, themes, distinctive_elements
+            """
+
+# Full language names for caption prompts, keyed by language code
+CAPTION_LANGUAGE_NAMES = {
+    "fr": "French", "es": "Spanish", "de": "German", 
+    "nl": "Dutch", "pt": "Portuguese", "it": "Italian",
+    "zh": "Mandarin Chinese", "ja": "Japanese", "ko": "Korean", "ru": "Russian"
+    # Add other mappings as needed based on your spec
+}
+
+# Gemini replies with JSON either inside a ```json fence or as the whole text
+_JSON_RESPONSE_RE = re.compile(r'```json\s*(.*?)\s*```|^\s*(\{.*\})\s*$', re.DOTALL)
+# Batched replies often wrap the array in a sentence or two, so take everything
+# from the first '[' to the last ']' when there is no fenced block
+_JSON_ARRAY_RESPONSE_RE = re.compile(r'```json\s*(.*?)\s*```|(\[.*\])', re.DOTALL)
+
 class AIHandler:
     """
     Handles AI caption generation functionality.
@@ -41,6 +145,13 @@ class AIHandler:
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.app_state = app_state
+        
+        # Build the Gemini models once instead of per request
+        self.vision_model = genai.GenerativeModel(GEMINI_VISION_MODEL) if GEMINI_API_KEY else None
+        self.text_model = genai.GenerativeModel(GEMINI_TEXT_MODEL) if GEMINI_API_KEY else None
+        
+        # Most recently used video analyses, keyed by file fingerprint
+        self._video_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def generate_caption(self, instructions: str, photo_editing: str, 
                          context_files: List[str] = None,
@@ -266,77 +377,279 @@ class AIHandler:
             Dict: Analysis results with content information
         """
         try:
-            if not GEMINI_API_KEY:
+            if self.vision_model is None:
                 self.logger.warning("No Gemini API key found. Skipping content analysis.")
                 return {"content_description": "Image content (Gemini API key not provided)"}
             
-            # Encode image for Gemini
-            with open(image_path, "rb") as img_file:
-                image_data = img_file.read()
-                image_parts = [{"mime_type": "image/jpeg", "data": base64.b64encode(image_data).decode("utf-8")}]
+            with open(image_path, "rb") as f:
+                image_data = f.read()
             
-            # Configure Gemini model - using updated model name
-            model = genai.GenerativeModel(GEMINI_VISION_MODEL)
+            def analyze() -> Dict[str, Any]:
+                max_size = (GEMINI_MAX_IMAGE_DIMENSION, GEMINI_MAX_IMAGE_DIMENSION)
+                with Image.open(io.BytesIO(image_data)) as img:
+                    # A JPEG that is already small enough and needs no rotation can be uploaded as-is
+                    if (img.format == "JPEG" and img.mode == "RGB" and max(img.size) <= GEMINI_MAX_IMAGE_DIMENSION
+                            and img.getexif().get(EXIF_ORIENTATION_TAG, 1) == 1):
+                        return self._analyze_image_bytes_with_gemini(image_data)
+                    
+                    # Otherwise downscale and re-encode before uploading. For JPEGs, draft()
+                    # lets the decoder scale down during decoding instead of afterwards.
+                    # Re-encoding drops EXIF, so apply its orientation to the pixels first,
+                    # or portrait phone photos would be sent sideways.
+                    img.draft("RGB", max_size)
+                    img = ImageOps.exif_transpose(img)
+                    if img.mode != "RGB":
+                        img = img.convert("RGB")
+                    img.thumbnail(max_size, Image.Resampling.LANCZOS)
+                    buffer = io.BytesIO()
+                    img.save(buffer, "JPEG", quality=GEMINI_JPEG_QUALITY)
+                
+                return self._analyze_image_bytes_with_gemini(buffer.getvalue())
             
-            # Prompt Gemini to analyze the image content, not the technical aspects
-            prompt = """
-            Analyze this image and identify:
-            1. Main subject matter (what/who is in the image)
-            2. Setting or environment
-            3. Activities or actions shown
-            4. Mood or feeling conveyed
-            5. Any themes or concepts represented
-            6. Any distinctive visual elements
+            return self._cached_analysis(image_data, CONTENT_ANALYSIS_PROMPT, analyze)
             
-            Focus ONLY on what's actually in the image, not how it was created or edited.
-            Format your response as a JSON with these keys: main_subject, setting, activities, mood, themes, distinctive_elements
-            """
+        except Exception as e:
+            self.logger.error(f"Error analyzing image with Gemini: {e}")
+            return {"content_description": f"Error analyzing image content: {str(e)}", "error": str(e)}
+    
+    def _cached_analysis(self, content: bytes, prompt: str,
+                         analyze: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a Gemini analysis from the on-disk cache, running it on a miss.
+        
+        Entries are keyed by the SHA-256 of the content, prompt and model, and
+        expire after ANALYSIS_CACHE_TTL. At most CACHE_MAX_SIZE entries are kept.
+        
+        Args:
+            content: Raw bytes of the media being analyzed
+            prompt: Prompt the analysis is run with
+            analyze: Callable producing the analysis on a cache miss
+            
+        Returns:
+            Dict: Cached or freshly computed analysis
+        """
+        cache_path = self._analysis_cache_path(content, prompt)
+        if cache_path is None:
+            return analyze()
+        
+        cached = self._load_cached_analysis(cache_path)
+        if cached is not None:
+            self.logger.info("Using cached Gemini analysis")
+            return cached
+        
+        result = analyze()
+        self._store_cached_analysis(cache_path, result)
+        return result
+    
+    def _analysis_cache_path(self, content: bytes, prompt: str) -> Optional[str]:
+        """
+        Get the on-disk cache file for an analysis of some content.
+        
+        Args:
+            content: Raw bytes of the media being analyzed
+            prompt: Prompt the analysis is run with
+            
+        Returns:
+            Optional[str]: Cache file path, or None if caching is disabled
+        """
+        if not const.CACHE_ENABLED:
+            return None
+        
+        digest = hashlib.sha256(content)
+        digest.update(prompt.encode())
+        digest.update(GEMINI_VISION_MODEL.encode())
+        return os.path.join(const.ANALYSIS_CACHE_DIR, f"{digest.hexdigest()}.json")
+    
+    def _load_cached_analysis(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Read an unexpired analysis from the on-disk cache, or None if there is none."""
+        try:
+            if time.time() - os.path.getmtime(cache_path) >= const.ANALYSIS_CACHE_TTL:
+                os.remove(cache_path)
+                return None
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # Missing or unreadable entries are simply recomputed
+        return None
+    
+    def _load_cached_frame_analysis(self, image_data: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Find an on-disk analysis of a video frame.
+        
+        Frames are analyzed with the batched prompt, or with the single-image prompt
+        when the batch falls back, so entries made with either are accepted.
+        
+        Args:
+            image_data: JPEG data of the frame
+            
+        Returns:
+            Optional[Dict]: Cached analysis, or None if there is none
+        """
+        for prompt in (BATCH_CONTENT_ANALYSIS_PROMPT, CONTENT_ANALYSIS_PROMPT):
+            cache_path = self._analysis_cache_path(image_data, prompt)
+            cached = self._load_cached_analysis(cache_path) if cache_path else None
+            if cached is not None:
+                return cached
+        return None
+    
+    def _store_cached_analysis(self, cache_path: str, result: Dict[str, Any]):
+        """Write an analysis to the on-disk cache, skipping failed analyses."""
+        # Don't pin transient Gemini failures in the cache
+        if not result or "error" in result:
+            return
+        
+        try:
+            os.makedirs(const.ANALYSIS_CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write analysis cache entry: {e}")
+            return
+        
+        self._prune_analysis_cache()
+    
+    def _prune_analysis_cache(self):
+        """
+        Delete expired on-disk analyses, then the oldest ones beyond CACHE_MAX_SIZE.
+        """
+        try:
+            with os.scandir(const.ANALYSIS_CACHE_DIR) as it:
+                entries = [(entry.stat().st_mtime, entry.path) for entry in it
+                           if entry.is_file() and entry.name.endswith(".json")]
+        except OSError as e:
+            self.logger.warning(f"Could not list analysis cache: {e}")
+            return
+        
+        entries.sort(reverse=True)  # Newest first
+        expired_before = time.time() - const.ANALYSIS_CACHE_TTL
+        for index, (mtime, path) in enumerate(entries):
+            if index >= const.CACHE_MAX_SIZE or mtime <= expired_before:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Already removed by another writer
+    
+    def _analyze_image_bytes_with_gemini(self, image_bytes: bytes) -> Dict[str, Any]:
+        """
+        Analyze JPEG-encoded image data using Google's Gemini model.
+        
+        Args:
+            image_bytes: JPEG data, already downscaled for upload
+            
+        Returns:
+            Dict: Analysis results with content information
+        """
+        try:
+            if self.vision_model is None:
+                self.logger.warning("No Gemini API key found. Skipping content analysis.")
+                return {"content_description": "Image content (Gemini API key not provided)"}
+            
+            # The SDK accepts raw bytes, so skip the base64 round trip
+            image_parts = [{"mime_type": "image/jpeg", "data": image_bytes}]
             
             # Get response from Gemini
-            response = model.generate_content([prompt] + image_parts)
+            response = self.vision_model.generate_content([CONTENT_ANALYSIS_PROMPT] + image_parts)
             
-            # Extract JSON from response
-            try:
-                # Try to parse as proper JSON if formatted correctly
-                import json
-                import re
-                
-                # Clean up response text to extract JSON
-                response_text = response.text
-                # Look for JSON pattern between code fences or standalone
-                json_match = re.search(r'```json\s*(.*?)\s*```|^\s*(\{.*\})\s*$', response_text, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1) if json_match.group(1) else json_match.group(2)
-                    content_analysis = json.loads(json_str)
-                else:
-                    # Fallback: create structured result from text
-                    content_analysis = {
-                        "content_description": response.text,
-                        "main_subject": "",
-                        "setting": "",
-                        "activities": "",
-                        "mood": "",
-                        "themes": [],
-                        "distinctive_elements": []
-                    }
-            except Exception as parse_err:
-                self.logger.warning(f"Could not parse Gemini JSON response: {parse_err}")
-                content_analysis = {
-                    "content_description": response.text,
-                    "main_subject": "",
-                    "setting": "",
-                    "activities": "",
-                    "mood": "",
-                    "themes": [],
-                    "distinctive_elements": []
-                }
+            content_analysis = self._parse_content_analysis(response.text)
             
-            self.logger.info(f"Gemini analyzed the image content successfully")
+            self.logger.debug("Gemini analyzed the image content successfully")
             return content_analysis
             
         except Exception as e:
             self.logger.error(f"Error analyzing image with Gemini: {e}")
-            return {"content_description": f"Error analyzing image content: {str(e)}"}
+            return {"content_description": f"Error analyzing image content: {str(e)}", "error": str(e)}
+    
+    def _analyze_frames_with_gemini(self, frame_images: List[bytes]) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Analyze several JPEG-encoded video frames with a single Gemini request.
+        
+        Falls back to concurrent per-frame requests if the batched reply cannot
+        be matched up with the frames.
+        
+        Args:
+            frame_images: JPEG data for each frame, in order
+            
+        Returns:
+            Tuple[List[Dict], str]: One analysis per frame, in the same order, and the
+            prompt that produced them (BATCH_CONTENT_ANALYSIS_PROMPT or CONTENT_ANALYSIS_PROMPT)
+        """
+        if len(frame_images) > 1 and self.vision_model is not None:
+            try:
+                prompt = BATCH_CONTENT_ANALYSIS_PROMPT.format(count=len(frame_images))
+                image_parts = [{"mime_type": "image/jpeg", "data": data} for data in frame_images]
+                response = self.vision_model.generate_content([prompt] + image_parts)
+                
+                analyses = self._parse_batch_content_analysis(response.text, len(frame_images))
+                if analyses is not None:
+                    self.logger.info(f"Gemini analyzed {len(frame_images)} frames in one request")
+                    return analyses, BATCH_CONTENT_ANALYSIS_PROMPT
+                self.logger.warning("Batched frame analysis did not match the frames, analyzing them one at a time")
+            except Exception as e:
+                self.logger.warning(f"Batched frame analysis failed, analyzing frames one at a time: {e}")
+        
+        if len(frame_images) <= 1:
+            return [self._analyze_image_bytes_with_gemini(data) for data in frame_images], CONTENT_ANALYSIS_PROMPT
+        
+        # The per-frame requests are network-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=min(GEMINI_MAX_CONCURRENT_REQUESTS, len(frame_images))) as executor:
+            return list(executor.map(self._analyze_image_bytes_with_gemini, frame_images)), CONTENT_ANALYSIS_PROMPT
+    
+    def _parse_batch_content_analysis(self, response_text: str, expected_count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse Gemini's batched content analysis reply into one dictionary per frame.
+        
+        Args:
+            response_text: Raw text returned by Gemini
+            expected_count: Number of frames that were sent
+            
+        Returns:
+            Optional[List[Dict]]: Parsed analyses, or None if the reply is not a JSON
+            array with one object per frame
+        """
+        try:
+            json_match = _JSON_ARRAY_RESPONSE_RE.search(response_text)
+            if json_match:
+                json_str = json_match.group(1) if json_match.group(1) else json_match.group(2)
+                analyses = json.loads(json_str)
+                if (isinstance(analyses, list) and len(analyses) == expected_count
+                        and all(isinstance(item, dict) for item in analyses)):
+                    return analyses
+        except Exception as parse_err:
+            self.logger.warning(f"Could not parse batched Gemini JSON response: {parse_err}")
+        
+        return None
+    
+    def _parse_content_analysis(self, response_text: str) -> Dict[str, Any]:
+        """
+        Parse Gemini's content analysis reply into a dictionary.
+        
+        Args:
+            response_text: Raw text returned by Gemini
+            
+        Returns:
+            Dict: Parsed analysis, or a structured fallback wrapping the raw text
+        """
+        try:
+            # Look for JSON pattern between code fences or standalone
+            json_match = _JSON_RESPONSE_RE.search(response_text)
+            if json_match:
+                json_str = json_match.group(1) if json_match.group(1) else json_match.group(2)
+                return json.loads(json_str)
+        except Exception as parse_err:
+            self.logger.warning(f"Could not parse Gemini JSON response: {parse_err}")
+        
+        # Fallback: create structured result from text
+        return {
+            "content_description": response_text,
+            "main_subject": "",
+            "setting": "",
+            "activities": "",
+            "mood": "",
+            "themes": [],
+            "distinctive_elements": []
+        }
     
     def _analyze_video_content(self, video_path: str) -> Dict[str, Any]:
         """
@@ -349,7 +662,14 @@ class AIHandler:
             Dict: Video analysis results
         """
         try:
-            from .video_handler import VideoHandler
+            fingerprint = self._file_fingerprint(video_path)
+            cached = self._video_analysis_cache.get(fingerprint) if fingerprint else None
+            if cached is not None:
+                self._video_analysis_cache.move_to_end(fingerprint)
+                self.logger.info(f"Using cached analysis for {os.path.basename(video_path)}")
+                return copy.deepcopy(cached)
+            
+            from ...features.media_processing.video_handler import VideoHandler
             video_handler = VideoHandler()
             
             analysis = {
@@ -362,43 +682,88 @@ class AIHandler:
                 "audio_present": False
             }
             
-            # Get basic video info
-            video_info = video_handler.get_video_info(video_path)
-            if "error" not in video_info:
-                analysis["duration"] = video_info.get("duration", 0)
-                analysis["resolution"] = f"{video_info.get('width', 0)}x{video_info.get('height', 0)}"
-                analysis["file_size"] = video_info.get("file_size", 0)
-                analysis["audio_present"] = video_info.get("has_audio", False)
-            
-            # Extract key frames for analysis
-            frame_paths = self._extract_key_frames(video_path)
-            
-            if frame_paths:
-                # Analyze each frame with Gemini
-                frame_analyses = []
-                for i, frame_path in enumerate(frame_paths[:5]):  # Limit to 5 frames
-                    try:
-                        frame_analysis = self._analyze_image_content_with_gemini(frame_path)
+            # Motion analysis only needs OpenCV decoding, which releases the GIL, so run
+            # it in the background while key frames are extracted and sent to Gemini
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                motion_future = executor.submit(self._analyze_video_motion, video_path)
+                    
+                # Get basic video info
+                video_info = video_handler.get_video_info(video_path)
+                if "error" not in video_info:
+                    analysis["duration"] = video_info.get("duration", 0)
+                    analysis["resolution"] = f"{video_info.get('width', 0)}x{video_info.get('height', 0)}"
+                    analysis["file_size"] = video_info.get("file_size", 0)
+                    analysis["audio_present"] = video_info.get("has_audio", False)
+                
+                # Extract key frames for analysis
+                frames = self._extract_key_frames(video_path)
+                
+                if frames:
+                    # Pick the frames worth sending: skip blank frames, let near-duplicates
+                    # share one request slot, and reuse results cached on disk
+                    frame_images = []
+                    frame_hashes = []
+                    frame_sources = []  # (frame index, cached analysis or index into frame_images)
+                    for i, frame in enumerate(frames[:5]):  # Limit to 5 frames
+                        try:
+                            stddev, dhash = self._frame_signature(frame)
+                            if stddev < MIN_FRAME_STDDEV:
+                                self.logger.debug("Skipping near-blank frame %d", i)
+                                continue
+                            
+                            source = next((index for index, pending_hash in enumerate(frame_hashes)
+                                           if (pending_hash ^ dhash).bit_count() <= FRAME_HASH_MAX_DISTANCE), None)
+                            if source is not None:
+                                self.logger.debug("Frame %d duplicates frame %d, reusing analysis", i, source)
+                            else:
+                                # The encoded bytes key the on-disk cache
+                                image_data = encode_jpeg(frame, GEMINI_JPEG_QUALITY)
+                                source = self._load_cached_frame_analysis(image_data)
+                                if source is not None:
+                                    self.logger.debug("Frame %d matches an analysis cached on disk", i)
+                                else:
+                                    frame_images.append(image_data)
+                                    frame_hashes.append(dhash)
+                                    source = len(frame_images) - 1
+                            frame_sources.append((i, source))
+                        except Exception as e:
+                            self.logger.warning(f"Error analyzing frame {i}: {e}")
+                    
+                    # Analyze all uncached frames with one Gemini request
+                    image_analyses, prompt = self._analyze_frames_with_gemini(frame_images) if frame_images else ([], "")
+                    
+                    # Without an API key the analyses are placeholders, which must not
+                    # outlive the missing key
+                    if self.vision_model is not None:
+                        for image_data, image_analysis in zip(frame_images, image_analyses):
+                            # Key the on-disk entry by the prompt that actually produced it
+                            cache_path = self._analysis_cache_path(image_data, prompt)
+                            if cache_path:
+                                self._store_cached_analysis(cache_path, image_analysis)
+                    
+                    frame_analyses = []
+                    for i, source in frame_sources:
+                        frame_analysis = source if isinstance(source, dict) else image_analyses[source]
                         if frame_analysis:
                             frame_analyses.append({
-                                "timestamp": i * (analysis["duration"] / len(frame_paths)),
+                                "timestamp": i * (analysis["duration"] / len(frames)),
                                 "analysis": frame_analysis
                             })
-                        
-                        # Clean up frame file
-                        if os.path.exists(frame_path):
-                            os.remove(frame_path)
-                    except Exception as e:
-                        self.logger.warning(f"Error analyzing frame {i}: {e}")
-                
-                analysis["frame_samples"] = frame_analyses
+                    
+                    analysis["frame_samples"] = frame_analyses
+                    
+                    # Generate overall content description from frame analyses
+                    if frame_analyses:
+                        analysis["content_description"] = self._synthesize_video_content(frame_analyses)
                 
-                # Generate overall content description from frame analyses
-                if frame_analyses:
-                    analysis["content_description"] = self._synthesize_video_content(frame_analyses)
+                analysis["motion_analysis"] = motion_future.result()
             
-            # Analyze motion (basic implementation)
-            analysis["motion_analysis"] = self._analyze_video_motion(video_path)
+            # Don't pin transient Gemini failures or keyless placeholders in the cache
+            if (fingerprint and self.vision_model is not None
+                    and not any("error" in sample["analysis"] for sample in analysis["frame_samples"])):
+                self._video_analysis_cache[fingerprint] = copy.deepcopy(analysis)
+                if len(self._video_analysis_cache) > VIDEO_ANALYSIS_CACHE_SIZE:
+                    self._video_analysis_cache.popitem(last=False)
             
             return analysis
             
@@ -406,7 +771,32 @@ class AIHandler:
             self.logger.error(f"Error analyzing video content: {e}")
             return {}
     
-    def _extract_key_frames(self, video_path: str, num_frames: int = 5) -> List[str]:
+    def _file_fingerprint(self, file_path: str) -> Optional[str]:
+        """
+        Compute a cheap content fingerprint for a media file.
+        
+        Hashes the first FINGERPRINT_HEAD_BYTES together with the file size and
+        modification time instead of reading the whole file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Optional[str]: Hex digest identifying the file's current contents, or None if unreadable
+        """
+        try:
+            stat = os.stat(file_path)
+            digest = hashlib.blake2b(digest_size=16)
+            with open(file_path, "rb") as f:
+                digest.update(f.read(FINGERPRINT_HEAD_BYTES))
+        except OSError as e:
+            self.logger.warning(f"Could not fingerprint {file_path}: {e}")
+            return None
+        
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+    
+    def _extract_key_frames(self, video_path: str, num_frames: int = 5) -> List[np.ndarray]:
         """
         Extract key frames from a video for analysis.
         
@@ -415,41 +805,65 @@ class AIHandler:
             num_frames: Number of frames to extract
             
         Returns:
-            List[str]: Paths to extracted frame images
+            List[np.ndarray]: BGR frames, downscaled to the Gemini upload size
         """
         try:
-            import cv2
-            import tempfile
-            
             cap = cv2.VideoCapture(video_path)
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
             fps = cap.get(cv2.CAP_PROP_FPS)
             duration = total_frames / fps if fps > 0 else 0
             
-            frame_paths = []
+            frames = []
             
             if duration > 0:
-                # Extract frames at regular intervals
-                for i in range(num_frames):
-                    timestamp = (i + 1) * duration / (num_frames + 1)
-                    frame_number = int(timestamp * fps)
-                    
+                # Extract frames at regular intervals. Very short clips can map several
+                # timestamps onto the same frame, so dedupe and read them in order.
+                frame_numbers = sorted({
+                    min(int((i + 1) * duration / (num_frames + 1) * fps), total_frames - 1)
+                    for i in range(num_frames)
+                })
+                for frame_number in frame_numbers:
                     cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
                     ret, frame = cap.read()
                     
                     if ret:
-                        # Save frame as temporary image
-                        temp_file = tempfile.NamedTemporaryFile(suffix='.jpg', delete=False)
-                        cv2.imwrite(temp_file.name, frame)
-                        frame_paths.append(temp_file.name)
+                        # Downscale to the size Gemini works at before encoding
+                        height, width = frame.shape[:2]
+                        scale = GEMINI_MAX_IMAGE_DIMENSION / max(height, width)
+                        if scale < 1.0:
+                            frame = cv2.resize(frame, (int(width * scale), int(height * scale)),
+                                               interpolation=cv2.INTER_AREA)
+                        
+                        # Keep the decoded frame in memory; no temp file round trip
+                        frames.append(frame)
             
             cap.release()
-            return frame_paths
+            return frames
             
         except Exception as e:
             self.logger.error(f"Error extracting key frames: {e}")
             return []
     
+    def _frame_signature(self, frame: np.ndarray) -> Tuple[float, int]:
+        """
+        Compute a cheap signature for a video frame.
+        
+        Args:
+            frame: BGR frame as returned by _extract_key_frames
+            
+        Returns:
+            Tuple[float, int]: (grayscale standard deviation, 64-bit difference hash)
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        stddev = float(gray.std())
+        
+        # Difference hash: compare horizontally adjacent pixels of a 9x8 thumbnail
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = np.packbits(small[:, 1:] > small[:, :-1])
+        dhash = int.from_bytes(bits.tobytes(), "big")
+        
+        return stddev, dhash
+    
     def _synthesize_video_content(self, frame_analyses: List[Dict]) -> str:
         """
         Synthesize content description from multiple frame analyses.
@@ -464,27 +878,24 @@ class AIHandler:
             if not frame_analyses:
                 return ""
             
-            # Extract common themes and objects
-            all_objects = []
-            all_activities = []
-            all_settings = []
+            # Count common themes and objects in a single pass. Gemini sometimes
+            # returns a list for a field, so join those to keep them hashable.
+            field_counts = {field: Counter() for field in ("main_subject", "activities", "setting")}
             
             for frame_data in frame_analyses:
                 analysis = frame_data.get("analysis", {})
                 
-                if "main_subject" in analysis:
-                    all_objects.append(analysis["main_subject"])
-                if "activities" in analysis:
-                    all_activities.append(analysis["activities"])
-                if "setting" in analysis:
-                    all_settings.append(analysis["setting"])
+                for field, counts in field_counts.items():
+                    value = analysis.get(field)
+                    if isinstance(value, list):
+                        value = ", ".join(str(item) for item in value if item)
+                    if value:
+                        counts[value] += 1
             
             # Find most common elements
-            from collections import Counter
-            
-            common_objects = [item for item, count in Counter(all_objects).most_common(3) if item]
-            common_activities = [item for item, count in Counter(all_activities).most_common(2) if item]
-            common_settings = [item for item, count in Counter(all_settings).most_common(1) if item]
+            common_objects = [item for item, count in field_counts["main_subject"].most_common(3)]
+            common_activities = [item for item, count in field_counts["activities"].most_common(2)]
+            common_settings = [item for item, count in field_counts["setting"].most_common(1)]
             
             # Build description
             description_parts = []
@@ -515,42 +926,39 @@ class AIHandler:
             str: Motion analysis description
         """
         try:
-            import cv2
-            
             cap = cv2.VideoCapture(video_path)
             
-            # Read first frame
-            ret, frame1 = cap.read()
-            if not ret:
-                cap.release()
-                return "No motion data available"
-            
-            # Convert to grayscale
-            gray1 = cv2.cvtColor(frame1, cv2.COLOR_BGR2GRAY)
-            
-            motion_scores = []
-            frame_count = 0
             max_frames = 30  # Analyze first 30 frames for motion
             
-            while frame_count < max_frames:
-                ret, frame2 = cap.read()
+            # Read the first frame plus max_frames more, as small grayscale thumbnails
+            # written straight into a preallocated stack. The full-size decode buffer and
+            # the downscaled colour frame are allocated once and reused for every frame.
+            width, height = MOTION_FRAME_SIZE
+            stack = np.empty((max_frames + 1, height, width), dtype=np.uint8)
+            small = np.empty((height, width, 3), dtype=np.uint8)
+            frame = None
+            frame_count = 0
+            while frame_count <= max_frames:
+                ret, frame = cap.read(frame)
                 if not ret:
                     break
-                
-                gray2 = cv2.cvtColor(frame2, cv2.COLOR_BGR2GRAY)
-                
-                # Calculate frame difference
-                diff = cv2.absdiff(gray1, gray2)
-                motion_score = diff.mean()
-                motion_scores.append(motion_score)
-                
-                gray1 = gray2
+                cv2.resize(frame, MOTION_FRAME_SIZE, dst=small, interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=stack[frame_count])
                 frame_count += 1
             
             cap.release()
             
-            if motion_scores:
-                avg_motion = sum(motion_scores) / len(motion_scores)
+            if frame_count == 0:
+                return "No motion data available"
+            
+            if frame_count > 1:
+                # Sum of absolute differences of every consecutive pair in one vectorized
+                # pass. max - min stays in uint8 without wrapping, and the sums are
+                # accumulated as int32; floats only appear in the final division.
+                prev_frames, next_frames = stack[:frame_count - 1], stack[1:frame_count]
+                abs_diff = np.maximum(prev_frames, next_frames) - np.minimum(prev_frames, next_frames)
+                motion_sad = abs_diff.sum(axis=(1, 2), dtype=np.int32)
+                avg_motion = float(motion_sad.mean()) / stack[0].size
                 
                 if avg_motion > 30:
                     return "High motion/dynamic content"
@@ -586,7 +994,7 @@ class AIHandler:
             str: Generated caption
         """
         try:
-            if not GEMINI_API_KEY:
+            if self.text_model is None:
                 # Fall back to sample caption if no API key
                 self.logger.warning("No Gemini API key found. Using sample caption generator.")
                 return self._generate_sample_caption(
@@ -618,20 +1026,11 @@ class AIHandler:
                     "distinctive_elements": []
                 }
             
-            # Configure Gemini model - using updated model name
-            model = genai.GenerativeModel(GEMINI_TEXT_MODEL)
-            
             # Language instruction
             language_instruction = ""
             if language_code.lower() != "en":
                 # Attempt to map code to full language name for a more natural prompt
-                language_map = {
-                    "fr": "French", "es": "Spanish", "de": "German", 
-                    "nl": "Dutch", "pt": "Portuguese", "it": "Italian",
-                    "zh": "Mandarin Chinese", "ja": "Japanese", "ko": "Korean", "ru": "Russian"
-                    # Add other mappings as needed based on your spec
-                }
-                language_name = language_map.get(language_code.lower(), language_code) # Fallback to code if name not found
+                language_name = CAPTION_LANGUAGE_NAMES.get(language_code.lower(), language_code) # Fallback to code if name not found
                 language_instruction = f"IMPORTANT: Generate the caption in {language_name}.\\n"
 
             # Determine if we're working with video or image content
@@ -710,9 +1109,9 @@ class AIHandler:
                 "contents": [prompt]
             }
 
-            self.logger.debug(f"Sending request to Gemini: {request_params}")
-            response = model.generate_content(**request_params)
-            self.logger.debug(f"Received response: {response}")
+            self.logger.debug("Sending request to Gemini: %s", request_params)
+            response = self.text_model.generate_content(**request_params)
+            self.logger.debug("Received response: %s", response)
 
             caption = response.text.strip()
             
@@ -766,33 +1165,25 @@ class AIHandler:
                 "dominant_tones": []
             }
         
+        # Scan the instructions once and find the first seasonal keyword
+        found_seasonal = set(_SEASONAL_KEYWORDS_RE.findall(instructions.lower()))
+        seasonal_keyword = next(
+            (keyword for keyword in SAMPLE_SEASONAL_KEYWORDS if keyword in found_seasonal), None
+        )
+        
         # Analyze context content for useful information
         business_keywords = []
         tone_keywords = []
         
         if context_content:
-            # Try to identify business type from context
-            business_types = [
-                "bakery", "restaurant", "cafe", "boutique", "salon", "fitness", 
-                "yoga", "retail", "photography", "art", "craft", "jewelry", 
-                "clothing", "travel", "hotel", "pet", "realty", "tech"
-            ]
-            
-            tone_types = [
-                "professional", "casual", "luxury", "budget-friendly", "artisan", 
-                "handcrafted", "traditional", "modern", "vintage", "sustainable", 
-                "organic", "vegan", "local", "family-owned", "premium", "customized"
-            ]
-            
+            # Try to identify business type and tone from context in one pass each
             lower_context = context_content.lower()
             
-            for business in business_types:
-                if business in lower_context:
-                    business_keywords.append(business)
+            found_businesses = set(_BUSINESS_TYPES_RE.findall(lower_context))
+            found_tones = set(_TONE_TYPES_RE.findall(lower_context))
             
-            for tone in tone_types:
-                if tone in lower_context:
-                    tone_keywords.append(tone)
+            business_keywords = [business for business in SAMPLE_BUSINESS_TYPES if business in found_businesses]
+            tone_keywords = [tone for tone in SAMPLE_TONE_TYPES if tone in found_tones]
                     
             self.logger.info(f"Found business type: {business_keywords} and tone: {tone_keywords}")
         
@@ -838,10 +1229,8 @@ class AIHandler:
             caption += f". Perfect for {business_keywords[1]} enthusiasts"
         
         # Add seasonal or promotional reference if in instructions
-        for keyword in ["summer", "spring", "fall", "winter", "holiday", "special", "new", "sale"]:
-            if keyword.lower() in instructions.lower():
-                caption += f". Ideal for your {keyword.title()} needs!"
-                break
+        if seasonal_keyword:
+            caption += f". Ideal for your {seasonal_keyword.title()} needs!"
         else:
             caption += "." # Add period if no seasonal reference
         
@@ -879,14 +1268,12 @@ class AIHandler:
         if not hashtags:
             hashtags = ["#PicOfTheDay", "#Photography", "#ShareYourStory"]
         
-        # Add instruction-based hashtags
-        for term in ["summer", "spring", "fall", "winter", "holiday", "special", "new", "sale"]:
-            if term.lower() in instructions.lower():
-                hashtags.append(f"#{term.title()}")
-                break
+        # Add instruction-based hashtags first so the limit below never drops them
+        if seasonal_keyword:
+            hashtags.insert(0, f"#{seasonal_keyword.title()}")
         
         # Limit hashtags to a reasonable number
-        hashtags = list(set(hashtags))[:6]  # Remove duplicates and limit to 6 hashtags
+        hashtags = list(dict.fromkeys(hashtags))[:6]  # Remove duplicates (keeping order) and limit to 6 hashtags
         
         # Finalize caption with hashtags
         caption += "\n\n" + " ".join(hashtags)
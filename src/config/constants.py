@@ -140,6 +140,8 @@ TASK_QUEUE_SIZE = 100
 CACHE_ENABLED = True
 CACHE_MAX_SIZE = 1000
 CACHE_TTL = 3600  # 1 hour in seconds
+ANALYSIS_CACHE_DIR = os.path.join(DATA_DIR, 'cache', 'analysis')  # Gemini image analyses
+ANALYSIS_CACHE_TTL = 30 * 24 * 3600  # 30 days in seconds
 
 # --- Error Messages ---
 ERROR_MESSAGES = {
@@ -718,33 +718,27 @@ class ImageEditHandler:
                                 min(255, new_b)
                             )
                 elif filter_name.lower() == "contrast":
-                    from PIL import ImageEnhance
                     enhancer = ImageEnhance.Contrast(img)
                     img = enhancer.enhance(1.5)
                 elif filter_name.lower() == "brightness":
-                    from PIL import ImageEnhance
                     enhancer = ImageEnhance.Brightness(img)
                     img = enhancer.enhance(1.2)
                 elif filter_name.lower() == "sharpness":
-                    from PIL import ImageEnhance
                     enhancer = ImageEnhance.Sharpness(img)
                     img = enhancer.enhance(1.5)
                 elif filter_name.lower() == "saturation":
-                    from PIL import ImageEnhance
                     enhancer = ImageEnhance.Color(img)
                     img = enhancer.enhance(1.5)
                 elif filter_name.lower() == "warm":
                     # Apply warm tone by enhancing red channel
                     img = img.convert("RGB")
                     r, g, b = img.split()
-                    from PIL import ImageEnhance
                     r = ImageEnhance.Brightness(r).enhance(1.2)
                     img = Image.merge("RGB", (r, g, b))
                 elif filter_name.lower() == "cool":
                     # Apply cool tone by enhancing blue channel
                     img = img.convert("RGB")
                     r, g, b = img.split()
-                    from PIL import ImageEnhance
                     b = ImageEnhance.Brightness(b).enhance(1.2)
                     img = Image.merge("RGB", (r, g, b))
             
@@ -1027,9 +1021,6 @@ class ImageEditHandler:
     
     def _apply_studio_ghibli_style(self, img: Image.Image) -> Image.Image:
         """Apply Studio Ghibli anime-style transformation."""
-        from PIL import ImageEnhance, ImageFilter
-        import numpy as np
-        
         # Convert to numpy for color manipulation
         img_array = np.array(img)
         
@@ -1064,9 +1055,6 @@ class ImageEditHandler:
     
     def _apply_oil_painting_effect(self, img: Image.Image) -> Image.Image:
         """Apply oil painting artistic effect."""
-        from PIL import ImageFilter, ImageEnhance
-        import numpy as np
-        
         # Convert to numpy array for advanced processing
         img_array = np.array(img)
         
@@ -1096,8 +1084,6 @@ class ImageEditHandler:
     
     def _apply_watercolor_effect(self, img: Image.Image) -> Image.Image:
         """Apply watercolor painting effect."""
-        from PIL import ImageEnhance, ImageFilter
-        
         # Reduce contrast for watercolor softness
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(0.8)
@@ -1113,8 +1099,6 @@ class ImageEditHandler:
     
     def _apply_pencil_sketch_effect(self, img: Image.Image) -> Image.Image:
         """Apply pencil sketch effect."""
-        from PIL import ImageFilter, ImageOps
-        
         # Convert to grayscale
         img = ImageOps.grayscale(img).convert("RGB")
         
@@ -1131,8 +1115,6 @@ class ImageEditHandler:
     
     def _apply_comic_book_effect(self, img: Image.Image) -> Image.Image:
         """Apply comic book/pop art effect."""
-        from PIL import ImageEnhance, ImageFilter
-        
         # High contrast for comic look
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.8)
@@ -1148,8 +1130,6 @@ class ImageEditHandler:
     
     def _apply_cyberpunk_effect(self, img: Image.Image) -> Image.Image:
         """Apply cyberpunk/neon effect."""
-        import numpy as np
-        
         # Convert to array for color manipulation
         img_array = np.array(img)
         
@@ -1161,7 +1141,6 @@ class ImageEditHandler:
         img = Image.fromarray(img_array.astype(np.uint8))
         
         # High contrast
-        from PIL import ImageEnhance
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.5)
         
@@ -1169,8 +1148,6 @@ class ImageEditHandler:
     
     def _apply_fantasy_effect(self, img: Image.Image) -> Image.Image:
         """Apply magical/fantasy effect."""
-        from PIL import ImageEnhance
-        
         # Enhance saturation for magical feel
         color_enhancer = ImageEnhance.Color(img)
         img = color_enhancer.enhance(1.3)
@@ -1186,8 +1163,6 @@ class ImageEditHandler:
     
     def _remove_background(self, img: Image.Image) -> Image.Image:
         """Simple background removal (edge-based)."""
-        from PIL import ImageFilter, ImageOps
-        
         # This is a simple implementation - for real background removal,
         # you'd use AI models like U2-Net
         
@@ -1202,8 +1177,6 @@ class ImageEditHandler:
     
     def _apply_gradient_background(self, img: Image.Image, color: str) -> Image.Image:
         """Apply gradient background."""
-        from PIL import ImageDraw
-        
         # Create a gradient background
         width, height = img.size
         gradient = Image.new("RGB", (width, height))
@@ -1222,8 +1195,6 @@ class ImageEditHandler:
     
     def _apply_bokeh_background(self, img: Image.Image) -> Image.Image:
         """Apply bokeh (blurred background) effect."""
-        from PIL import ImageFilter
-        
         # For simplicity, apply Gaussian blur to entire image
         # In reality, you'd detect subjects and only blur background
         blurred = img.filter(ImageFilter.GaussianBlur(radius=3))
@@ -1234,8 +1205,6 @@ class ImageEditHandler:
     
     def _apply_advanced_bw(self, img: Image.Image) -> Image.Image:
         """Apply professional black and white conversion."""
-        from PIL import ImageOps, ImageEnhance
-        
         # Convert to grayscale with good contrast
         img = ImageOps.grayscale(img).convert("RGB")
         
@@ -1247,8 +1216,6 @@ class ImageEditHandler:
     
     def _apply_vintage_effect(self, img: Image.Image) -> Image.Image:
         """Apply vintage/retro effect."""
-        import numpy as np
-        
         # Apply sepia tone
         img_array = np.array(img)
         
@@ -1266,7 +1233,6 @@ class ImageEditHandler:
         img = Image.fromarray(sepia_img.astype(np.uint8))
         
         # Reduce contrast for vintage look
-        from PIL import ImageEnhance
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(0.8)
         
@@ -1274,8 +1240,6 @@ class ImageEditHandler:
     
     def _apply_vibrant_colors(self, img: Image.Image) -> Image.Image:
         """Apply vibrant color enhancement."""
-        from PIL import ImageEnhance
-        
         # Enhance saturation
         color_enhancer = ImageEnhance.Color(img)
         img = color_enhancer.enhance(1.5)
@@ -1288,8 +1252,6 @@ class ImageEditHandler:
     
     def _apply_cinematic_look(self, img: Image.Image) -> Image.Image:
         """Apply cinematic color grading."""
-        import numpy as np
-        
         img_array = np.array(img).astype(float)
         
         # Apply teal-orange color grading (popular in movies)
@@ -1301,7 +1263,6 @@ class ImageEditHandler:
         img = Image.fromarray(img_array.astype(np.uint8))
         
         # Slight desaturation for film look
-        from PIL import ImageEnhance
         color_enhancer = ImageEnhance.Color(img)
         img = color_enhancer.enhance(0.9)
         
@@ -1309,8 +1270,6 @@ class ImageEditHandler:
     
     def _apply_warm_tone(self, img: Image.Image) -> Image.Image:
         """Apply warm color tone."""
-        import numpy as np
-        
         img_array = np.array(img).astype(float)
         
         # Enhance red and yellow
@@ -1322,8 +1281,6 @@ class ImageEditHandler:
     
     def _apply_cool_tone(self, img: Image.Image) -> Image.Image:
         """Apply cool color tone."""
-        import numpy as np
-        
         img_array = np.array(img).astype(float)
         
         # Enhance blue
@@ -1335,8 +1292,6 @@ class ImageEditHandler:
     
     def _apply_hdr_effect(self, img: Image.Image) -> Image.Image:
         """Apply HDR-like effect."""
-        from PIL import ImageEnhance
-        
         # Enhance local contrast
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.4)
@@ -1353,8 +1308,6 @@ class ImageEditHandler:
     
     def _apply_soft_light(self, img: Image.Image) -> Image.Image:
         """Apply soft, dreamy lighting effect."""
-        from PIL import ImageFilter, ImageEnhance
-        
         # Create soft glow
         blurred = img.filter(ImageFilter.GaussianBlur(radius=2))
         
@@ -1369,8 +1322,6 @@ class ImageEditHandler:
     
     def _apply_dramatic_effect(self, img: Image.Image) -> Image.Image:
         """Apply dramatic, high-contrast effect."""
-        from PIL import ImageEnhance
-        
         # High contrast
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.6)
@@ -1383,9 +1334,6 @@ class ImageEditHandler:
     
     def _apply_vignette_effect(self, img: Image.Image) -> Image.Image:
         """Apply vignette (dark edges) effect."""
-        import numpy as np
-        from PIL import ImageDraw
-        
         width, height = img.size
         
         # Create vignette mask
@@ -1397,7 +1345,6 @@ class ImageEditHandler:
         draw.ellipse([border, border, width-border, height-border], fill=255)
         
         # Apply Gaussian blur to soften vignette
-        from PIL import ImageFilter
         mask = mask.filter(ImageFilter.GaussianBlur(radius=border//2))
         
         # Apply vignette
@@ -1413,8 +1360,6 @@ class ImageEditHandler:
     
     def _apply_sharpening(self, img: Image.Image) -> Image.Image:
         """Apply advanced sharpening."""
-        from PIL import ImageFilter, ImageEnhance
-        
         # Apply unsharp mask
         img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
         
@@ -1426,8 +1371,6 @@ class ImageEditHandler:
     
     def _apply_skin_smoothing(self, img: Image.Image) -> Image.Image:
         """Apply skin smoothing for portraits."""
-        from PIL import ImageFilter
-        
         # Apply slight Gaussian blur for smoothing
         smoothed = img.filter(ImageFilter.GaussianBlur(radius=1))
         
@@ -1438,15 +1381,11 @@ class ImageEditHandler:
     
     def _apply_brightness_adjustment(self, img: Image.Image, factor: float) -> Image.Image:
         """Apply brightness adjustment."""
-        from PIL import ImageEnhance
-        
         brightness_enhancer = ImageEnhance.Brightness(img)
         return brightness_enhancer.enhance(factor)
     
     def _apply_instagram_filter(self, img: Image.Image) -> Image.Image:
         """Apply Instagram-style filter."""
-        from PIL import ImageEnhance
-        
         # Enhance colors
         color_enhancer = ImageEnhance.Color(img)
         img = color_enhancer.enhance(1.2)
@@ -1462,8 +1401,6 @@ class ImageEditHandler:
     
     def _apply_polaroid_effect(self, img: Image.Image) -> Image.Image:
         """Apply Polaroid instant photo effect."""
-        from PIL import ImageEnhance
-        
         # Vintage effect
         img = self._apply_vintage_effect(img)
         
@@ -1478,9 +1415,6 @@ class ImageEditHandler:
     
     def _apply_tilt_shift(self, img: Image.Image) -> Image.Image:
         """Apply tilt-shift miniature effect."""
-        from PIL import ImageFilter
-        import numpy as np
-        
         width, height = img.size
         
         # Create focus band in the middle
@@ -1505,7 +1439,6 @@ class ImageEditHandler:
         img = Image.fromarray(img_array.astype(np.uint8))
         
         # Enhance saturation for miniature look
-        from PIL import ImageEnhance
         color_enhancer = ImageEnhance.Color(img)
         img = color_enhancer.enhance(1.3)
         
@@ -1513,8 +1446,6 @@ class ImageEditHandler:
     
     def _apply_smart_enhancement(self, img: Image.Image) -> Image.Image:
         """Apply intelligent enhancement based on image analysis."""
-        from PIL import ImageEnhance, ImageStat
-        
         # Analyze image statistics
         stat = ImageStat.Stat(img)
         mean_brightness = sum(stat.mean) / 3
@@ -1535,8 +1466,6 @@ class ImageEditHandler:
     
     def _apply_subtle_enhancement(self, img: Image.Image) -> Image.Image:
         """Apply subtle enhancement as default."""
-        from PIL import ImageEnhance
-        
         # Slight contrast boost
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.1)
@@ -1549,8 +1478,6 @@ class ImageEditHandler:
     
     def _apply_dramatic_enhancement(self, img: Image.Image) -> Image.Image:
         """Apply dramatic enhancement for bold, striking effects."""
-        from PIL import ImageEnhance, ImageFilter
-        
         # High contrast for dramatic effect
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.6)
@@ -1571,8 +1498,6 @@ class ImageEditHandler:
     
     def _apply_professional_enhancement(self, img: Image.Image) -> Image.Image:
         """Apply professional enhancement for clean, crisp results."""
-        from PIL import ImageEnhance, ImageFilter
-        
         # Moderate contrast for professional look
         contrast_enhancer = ImageEnhance.Contrast(img)
         img = contrast_enhancer.enhance(1.25)
@@ -1592,8 +1517,6 @@ class ImageEditHandler:
     
     def _apply_food_photography_enhancement(self, img: Image.Image) -> Image.Image:
         """Apply food photography specific enhancements."""
-        from PIL import ImageEnhance, ImageFilter
-        
         # Warm tone for appetizing look
         img = self._apply_warm_tone(img)
         
@@ -1617,8 +1540,6 @@ class ImageEditHandler:
     
     def _apply_enhanced_default(self, img: Image.Image) -> Image.Image:
         """Apply enhanced default processing with more substantial changes."""
-        from PIL import ImageEnhance, ImageFilter, ImageStat
-        
         # Analyze image characteristics
         stat = ImageStat.Stat(img)
         mean_brightness = sum(stat.mean) / 3
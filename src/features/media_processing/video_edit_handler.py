@@ -15,6 +15,12 @@ from PIL import Image, ImageEnhance
 
 from ...config import constants as const
 
+# Teal-orange grade (popular in films) as a per-channel uint8 lookup table, so
+# each frame stays in uint8 instead of being widened to float64
+_CINEMATIC_GRADE_LUT = np.clip(
+    np.arange(256, dtype=np.float64)[:, None] * np.array([1.1, 0.95, 1.05]), 0, 255  # Red, Green, Blue
+).astype(np.uint8).reshape(1, 256, 3)
+
 class VideoEditHandler:
     """
     Handles comprehensive video editing operations.
@@ -127,15 +133,8 @@ class VideoEditHandler:
             contrast_enhancer = ImageEnhance.Contrast(img)
             img = contrast_enhancer.enhance(1.2)
             
-            # Adjust color balance for cinematic look
-            img_array = np.array(img).astype(float)
-            
-            # Teal and orange color grading (popular in films)
-            img_array[:, :, 0] = np.clip(img_array[:, :, 0] * 1.1, 0, 255)  # Red
-            img_array[:, :, 1] = np.clip(img_array[:, :, 1] * 0.95, 0, 255)  # Green
-            img_array[:, :, 2] = np.clip(img_array[:, :, 2] * 1.05, 0, 255)  # Blue
-            
-            return img_array.astype(np.uint8)
+            # Adjust color balance for cinematic look (teal and orange)
+            return cv2.LUT(np.asarray(img), _CINEMATIC_GRADE_LUT)
         
         return clip.fl(color_grade_frame)
     
@@ -4,18 +4,26 @@ Implements highlight reel generation, story assistant, and thumbnail selection.
 """
 
 import os
+import re
 import logging
 import tempfile
 import math
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import cv2
 import numpy as np
-from moviepy.editor import VideoFileClip, concatenate_videoclips, CompositeVideoClip
-from moviepy.video.fx import resize, crop
-from PIL import Image
+from moviepy.editor import VideoFileClip, AudioFileClip, concatenate_videoclips, CompositeVideoClip
 
 from ...config import constants as const
+from ...utils.jpeg_encoder import encode_jpeg
+
+# Prompt cues for where a highlight should come from. Matching is by substring,
+# case-insensitive, and cue groups are checked in this order.
+_BEGINNING_CUE_RE = re.compile(r"beginning|start", re.IGNORECASE)
+_END_CUE_RE = re.compile(r"end|finish", re.IGNORECASE)
+_MIDDLE_CUE_RE = re.compile(r"middle", re.IGNORECASE)
 
 
 class VideoHandler:
@@ -87,7 +95,7 @@ class VideoHandler:
                     output_path,
                     codec='libx264',
                     audio_codec='aac',
-                    temp_audiofile='temp-audio.m4a',
+                    temp_audiofile=self._temp_audio_path(),
                     remove_temp=True
                 )
                 
@@ -127,6 +135,9 @@ class VideoHandler:
         Returns:
             Tuple[bool, List[str], str]: (success, list_of_output_paths, message)
         """
+        # Clips are written one after another, so they can share one scratch audio file
+        temp_audio_path = self._temp_audio_path()
+        
         try:
             if not os.path.exists(video_path):
                 return False, [], f"Video file not found: {video_path}"
@@ -166,7 +177,7 @@ class VideoHandler:
                     output_path,
                     codec='libx264',
                     audio_codec='aac',
-                    temp_audiofile=f'temp-audio-{i}.m4a',
+                    temp_audiofile=temp_audio_path,
                     remove_temp=True
                 )
                 
@@ -192,6 +203,13 @@ class VideoHandler:
         except Exception as e:
             self.logger.exception(f"Error creating story clips: {e}")
             return False, [], f"Error creating story clips: {str(e)}"
+        
+        finally:
+            # MoviePy only removes the scratch file after a successful write
+            try:
+                os.remove(temp_audio_path)
+            except OSError:
+                pass
     
     def generate_video_thumbnails(self, video_path: str, num_thumbnails: int = 6) -> Tuple[bool, List[str], str]:
         """
@@ -221,28 +239,29 @@ class VideoHandler:
             # Ensure output directory exists
             os.makedirs(const.OUTPUT_DIR, exist_ok=True)
             
-            # Generate thumbnails at evenly spaced intervals
+            # Decode all frames first at evenly spaced intervals; the times only
+            # increase, so the reader moves forward through the file once
+            frames = []
             for i in range(num_thumbnails):
                 # Calculate time position (avoid very beginning and end)
                 time_position = (duration * (i + 1)) / (num_thumbnails + 1)
-                
-                # Extract frame
-                frame = clip.get_frame(time_position)
-                
-                # Convert to PIL Image
-                pil_image = Image.fromarray(frame)
+                frames.append(clip.get_frame(time_position))
                 
                 # Generate thumbnail filename
                 thumbnail_filename = f"{base_name}_thumb_{i+1}_{timestamp}.jpg"
-                thumbnail_path = os.path.join(const.OUTPUT_DIR, thumbnail_filename)
-                
-                # Save thumbnail
-                pil_image.save(thumbnail_path, 'JPEG', quality=90)
-                thumbnail_paths.append(thumbnail_path)
+                thumbnail_paths.append(os.path.join(const.OUTPUT_DIR, thumbnail_filename))
             
             # Clean up
             clip.close()
             
+            # Encode thumbnails in parallel; the JPEG encoder releases the GIL
+            def save_thumbnail(frame, thumbnail_path):
+                with open(thumbnail_path, 'wb') as f:
+                    f.write(encode_jpeg(frame, 90, rgb=True))
+            
+            with ThreadPoolExecutor(max_workers=max(1, min(4, len(frames)))) as executor:
+                list(executor.map(save_thumbnail, frames, thumbnail_paths))
+            
             self.logger.info(f"Generated {len(thumbnail_paths)} thumbnails")
             return True, thumbnail_paths, f"Generated {len(thumbnail_paths)} thumbnails"
             
@@ -278,9 +297,6 @@ class VideoHandler:
             # Extract frame
             frame = clip.get_frame(timestamp)
             
-            # Convert to PIL Image
-            pil_image = Image.fromarray(frame)
-            
             # Generate thumbnail filename
             base_name = os.path.splitext(os.path.basename(video_path))[0]
             timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -291,7 +307,8 @@ class VideoHandler:
             os.makedirs(const.OUTPUT_DIR, exist_ok=True)
             
             # Save thumbnail
-            pil_image.save(thumbnail_path, 'JPEG', quality=90)
+            with open(thumbnail_path, 'wb') as f:
+                f.write(encode_jpeg(frame, 90, rgb=True))
             
             # Clean up
             clip.close()
@@ -327,7 +344,6 @@ class VideoHandler:
             
             # Load video and audio
             video_clip = VideoFileClip(video_path)
-            from moviepy.editor import AudioFileClip
             audio_clip = AudioFileClip(audio_path)
             
             # Adjust audio volume
@@ -355,7 +371,7 @@ class VideoHandler:
                 output_path,
                 codec='libx264',
                 audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
+                temp_audiofile=self._temp_audio_path(),
                 remove_temp=True
             )
             
@@ -419,6 +435,15 @@ class VideoHandler:
             self.logger.exception(f"Error getting video info: {e}")
             return {}
     
+    def _temp_audio_path(self) -> str:
+        """
+        Get a unique scratch path for MoviePy's intermediate audio track.
+        
+        Keeps the file out of the working directory and stops concurrent
+        renders from writing to the same file.
+        """
+        return os.path.join(self.temp_dir, f"crows_eye_audio_{uuid.uuid4().hex}.m4a")
+    
     def _analyze_video_for_highlights(self, clip, target_duration: int, prompt: str) -> List[Tuple[float, float]]:
         """
         Analyze video to find highlight segments based on prompt.
@@ -432,12 +457,12 @@ class VideoHandler:
         # Simple strategy: take segments from beginning, middle, and end
         segments = []
         
-        if "beginning" in prompt.lower() or "start" in prompt.lower():
+        if _BEGINNING_CUE_RE.search(prompt):
             segments.append((0, min(segment_length, duration)))
-        elif "end" in prompt.lower() or "finish" in prompt.lower():
+        elif _END_CUE_RE.search(prompt):
             start_time = max(0, duration - segment_length)
             segments.append((start_time, duration))
-        elif "middle" in prompt.lower():
+        elif _MIDDLE_CUE_RE.search(prompt):
             start_time = (duration - segment_length) / 2
             segments.append((start_time, start_time + segment_length))
         else:
@@ -485,11 +510,13 @@ class VideoHandler:
             x_offset = 0
             y_offset = (height - new_height) // 2
         
-        # Crop the video
-        cropped_clip = crop(clip, x1=x_offset, y1=y_offset, 
-                           x2=x_offset + new_width, y2=y_offset + new_height)
+        # Crop and resize to standard story dimensions (1080x1920) in a single
+        # per-frame transform instead of chaining two MoviePy effects
+        story_size = (1080, 1920)
+        interpolation = cv2.INTER_AREA if new_width >= story_size[0] else cv2.INTER_LINEAR
         
-        # Resize to standard story dimensions (1080x1920)
-        final_clip = resize(cropped_clip, (1080, 1920))
+        def crop_and_resize(frame):
+            cropped = frame[y_offset:y_offset + new_height, x_offset:x_offset + new_width]
+            return cv2.resize(cropped, story_size, interpolation=interpolation)
         
-        return final_clip 
\ No newline at end of file
+        return clip.fl_image(crop_and_resize) 
\ No newline at end of file
@@ -5,10 +5,13 @@ Provides a single interface for posting to all supported platforms.
 import os
 import json
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Tuple, Callable, Mapping
 from datetime import datetime
-from PySide6.QtCore import QObject, Signal, QThread
+from PySide6.QtCore import QObject, Signal, QThread, Qt
 
 from ...api.meta.meta_posting_handler import MetaPostingHandler
 from ...api.instagram.instagram_api_handler import InstagramAPIHandler
@@ -20,6 +23,121 @@ from ...api.threads.threads_api_handler import ThreadsAPIHandler
 from ...api.youtube.youtube_api_handler import YouTubeAPIHandler
 from .platform_optimizers import PlatformOptimizerFactory
 
+# Seconds to reuse the platform handlers' posting status. Building it makes
+# several handlers test their API connection, and the UI asks for the
+# available platforms and their errors back to back.
+PLATFORM_STATUS_CACHE_TTL = 5.0
+
+# Pacing for posts through a single platform handler, to stay clear of API rate
+# limits: sustained posts per second, and how many may go out back to back
+POST_RATE_PER_SECOND = 1.0
+POST_RATE_BURST = 1
+
+# Signals every platform handler shares with UnifiedPostingSignals and that are
+# forwarded unchanged
+FORWARDED_SIGNALS = ('upload_started', 'upload_progress', 'upload_success', 'upload_error', 'status_update')
+
+# Posting limits for each platform. Read-only (including each platform's entry),
+# since get_platform_limits hands the same mapping to every caller.
+PLATFORM_LIMITS = MappingProxyType({platform: MappingProxyType(limits) for platform, limits in {
+    'instagram': {
+        'max_caption_length': 2200,
+        'max_image_size': 8 * 1024 * 1024,  # 8MB
+        'max_video_size': 100 * 1024 * 1024,  # 100MB
+        'max_video_duration': 60,  # seconds
+        'requires_media': True
+    },
+    'facebook': {
+        'max_caption_length': 63206,
+        'max_image_size': 8 * 1024 * 1024,  # 8MB
+        'max_video_size': 100 * 1024 * 1024,  # 100MB
+        'max_video_duration': 240,  # seconds
+        'requires_media': False
+    },
+
+    'instagram_api': {
+        'max_caption_length': 2200,
+        'max_image_size': 8 * 1024 * 1024,  # 8MB
+        'max_video_size': 100 * 1024 * 1024,  # 100MB
+        'max_video_duration': 60,  # seconds
+        'requires_media': True
+    },
+    'tiktok': {
+        'max_caption_length': 2200,
+        'max_image_size': 20 * 1024 * 1024,  # 20MB per image
+        'max_video_size': 4 * 1024 * 1024 * 1024,  # 4GB
+        'max_video_duration': 600,  # 10 minutes
+        'max_carousel_images': 35,  # Photo carousels supported
+        'requires_media': True,
+        'supports_photo_carousel': True,
+        'supports_video': True
+    },
+    'google_business': {
+        'max_caption_length': 1500,
+        'max_image_size': 10 * 1024 * 1024,  # 10MB
+        'max_video_size': 100 * 1024 * 1024,  # 100MB
+        'max_video_duration': 30,  # seconds
+        'requires_media': False
+    },
+    'bluesky': {
+        'max_caption_length': 300,
+        'max_image_size': 1 * 1024 * 1024,  # 1MB
+        'max_video_size': 0,  # No video support
+        'max_video_duration': 0,
+        'requires_media': False,
+        'image_only': True
+    },
+    'pinterest': {
+        'max_caption_length': 500,
+        'max_image_size': 32 * 1024 * 1024,  # 32MB
+        'max_video_size': 2 * 1024 * 1024 * 1024,  # 2GB
+        'max_video_duration': 900,  # 15 minutes
+        'max_carousel_images': 5,  # Gallery/carousel pins supported
+        'requires_media': True,
+        'supports_gallery': True,
+        'supports_carousel': True,
+        'supports_boards': True
+    },
+    'threads': {
+        'max_caption_length': 500,
+        'max_image_size': 8 * 1024 * 1024,  # 8MB
+        'max_video_size': 100 * 1024 * 1024,  # 100MB
+        'max_video_duration': 60,  # seconds
+        'requires_media': False
+    }
+}.items()})
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket, starting full.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take one token, sleeping until it is available if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Reserve the token now, so concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
 class UnifiedPostingSignals(QObject):
     """Signals for unified posting operations."""
     upload_started = Signal(str)  # platform
@@ -47,71 +165,119 @@ class UnifiedPostingHandler:
         self.threads_handler = ThreadsAPIHandler()
         self.youtube_handler = YouTubeAPIHandler()
         
+        # Handler and post method for each platform name, so posting looks the
+        # platform up once instead of walking an if/elif chain
+        self._platform_handlers = {
+            'instagram': self.meta_handler,
+            'facebook': self.meta_handler,
+            'instagram_api': self.instagram_handler,
+            'tiktok': self.tiktok_handler,
+            'google_business': self.google_business_handler,
+            'google_my_business': self.google_business_handler,
+            'bluesky': self.bluesky_handler,
+            'pinterest': self.pinterest_handler,
+            'threads': self.threads_handler,
+            'youtube': self.youtube_handler,
+            'youtube_shorts': self.youtube_handler
+        }
+        self._rate_limiters = {
+            handler: TokenBucket(POST_RATE_PER_SECOND, POST_RATE_BURST)
+            for handler in set(self._platform_handlers.values())
+        }
+        self._dispatch: Dict[str, Callable[..., Tuple[bool, str]]] = {
+            'instagram': lambda media_path, caption, is_video, **kwargs:
+                self.meta_handler.post_to_instagram(media_path, caption, is_video),
+            'facebook': lambda media_path, caption, is_video, **kwargs:
+                self.meta_handler.post_to_facebook(media_path, caption, is_video),
+            'instagram_api': lambda media_path, caption, is_video, **kwargs:
+                self.instagram_handler.post_media(media_path, caption, is_video),
+            'tiktok': lambda media_path, caption, is_video, **kwargs:
+                self.tiktok_handler.post_media(media_path=media_path, caption=caption, is_video=is_video),
+            'google_business': lambda media_path, caption, is_video, **kwargs:
+                self.google_business_handler.post_media(media_path, caption, is_video),
+            'google_my_business': lambda media_path, caption, is_video, **kwargs:
+                self.google_business_handler.post_media(media_path, caption, is_video),
+            'bluesky': lambda media_path, caption, is_video, **kwargs:
+                self.bluesky_handler.post_media(media_path, caption, is_video),
+            'pinterest': lambda media_path, caption, is_video, **kwargs:
+                self.pinterest_handler.post_media(media_path=media_path, caption=caption, is_video=is_video),
+            'threads': lambda media_path, caption, is_video, **kwargs:
+                self.threads_handler.post_media(media_path, caption, is_video),
+            'youtube': lambda media_path, caption, is_video, **kwargs:
+                self.youtube_handler.post_media(media_path, caption, is_video, is_short=False, **kwargs),
+            'youtube_shorts': lambda media_path, caption, is_video, **kwargs:
+                self.youtube_handler.post_media(media_path, caption, is_video, is_short=True, **kwargs)
+        }
+        
         # Initialize platform optimizer factory
         self.optimizer_factory = PlatformOptimizerFactory()
         
+        # Handler posting statuses and when they were fetched (monotonic seconds)
+        self._status_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._status_cache_time = 0.0
+        
         # Connect signals
         self._connect_signals()
         
     def _connect_signals(self):
         """Connect signals from individual platform handlers."""
-        # Meta signals
-        self.meta_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.meta_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.meta_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.meta_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.meta_handler.signals.status_update.connect(self.signals.status_update)
+        handlers = (
+            self.meta_handler,
+            self.instagram_handler,
+            self.tiktok_handler,
+            self.google_business_handler,
+            self.bluesky_handler,
+            self.pinterest_handler,
+            self.threads_handler,
+            self.youtube_handler
+        )
+        
+        # Forwarding is a plain re-emit, so do it directly in the emitting thread; the
+        # connections to the final receivers still decide whether delivery is queued
+        for handler in handlers:
+            for name in FORWARDED_SIGNALS:
+                getattr(handler.signals, name).connect(getattr(self.signals, name), Qt.ConnectionType.DirectConnection)
+        
+        # Any handler status change makes the cached posting statuses stale
+        self.signals.status_update.connect(self._invalidate_status_cache)
+    
+    def _invalidate_status_cache(self, *_args):
+        """Drop the cached handler posting statuses so the next lookup refetches them."""
+        self._status_cache = None
+    
+    def _get_platform_statuses(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a snapshot of every platform handler's posting status, reusing a recent one.
         
-
+        Several handlers test their API connection while building their status,
+        so the handlers are queried concurrently and a refresh costs about one
+        round trip instead of one per handler.
+        
+        Returns:
+            Dictionary mapping handler names to their posting status
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache_time < PLATFORM_STATUS_CACHE_TTL:
+            return self._status_cache
+        
+        handlers = {
+            'meta': self.meta_handler,
+            'instagram': self.instagram_handler,
+            'tiktok': self.tiktok_handler,
+            'google_business': self.google_business_handler,
+            'bluesky': self.bluesky_handler,
+            'pinterest': self.pinterest_handler,
+            'threads': self.threads_handler,
+            'youtube': self.youtube_handler
+        }
+        
+        with ThreadPoolExecutor(max_workers=len(handlers)) as executor:
+            statuses = dict(zip(handlers, executor.map(lambda handler: handler.get_posting_status(),
+                                                       handlers.values())))
         
-        # Instagram signals
-        self.instagram_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.instagram_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.instagram_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.instagram_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.instagram_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # TikTok signals
-        self.tiktok_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.tiktok_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.tiktok_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.tiktok_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.tiktok_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # Google Business signals
-        self.google_business_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.google_business_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.google_business_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.google_business_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.google_business_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # BlueSky signals
-        self.bluesky_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.bluesky_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.bluesky_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.bluesky_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.bluesky_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # Pinterest signals
-        self.pinterest_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.pinterest_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.pinterest_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.pinterest_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.pinterest_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # Threads signals
-        self.threads_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.threads_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.threads_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.threads_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.threads_handler.signals.status_update.connect(self.signals.status_update)
-        
-        # YouTube signals
-        self.youtube_handler.signals.upload_started.connect(self.signals.upload_started)
-        self.youtube_handler.signals.upload_progress.connect(self.signals.upload_progress)
-        self.youtube_handler.signals.upload_success.connect(self.signals.upload_success)
-        self.youtube_handler.signals.upload_error.connect(self.signals.upload_error)
-        self.youtube_handler.signals.status_update.connect(self.signals.status_update)
+        self._status_cache = statuses
+        self._status_cache_time = now
+        return statuses
     
     def post_to_platforms_optimized(self, platforms: List[str], media_paths: List[str] = None, 
                                    media_path: str = None, caption: str = "", is_video: bool = False, 
@@ -132,71 +298,59 @@ class UnifiedPostingHandler:
         Returns:
             Dictionary mapping platform names to (success, message) tuples
         """
-        results = {}
-        
         # Handle media paths (support both single and multiple files)
         effective_media_paths = media_paths if media_paths else ([media_path] if media_path else [])
         effective_media_path = effective_media_paths[0] if effective_media_paths else None
         is_gallery = len(effective_media_paths) > 1
         
-        for platform in platforms:
+        def post_one(platform: str) -> Tuple[bool, str]:
             platform_lower = platform.lower()
             
-            try:
-                # Apply platform-specific optimizations if enabled
-                optimized_media_paths = effective_media_paths
-                optimized_media_path = effective_media_path
-                optimized_caption = caption
-                optimized_kwargs = kwargs.copy()
-                
-                if optimize_content and effective_media_path:
-                    optimizer = self.optimizer_factory.get_optimizer(platform_lower)
-                    
-                    # Special handling for YouTube Shorts
-                    is_short = platform_lower == 'youtube_shorts'
-                    if platform_lower in ['youtube', 'youtube_shorts']:
-                        optimization_result = optimizer.optimize_content(
-                            effective_media_path, caption, "auto", is_short=is_short, **kwargs
-                        )
-                    else:
-                        optimization_result = optimizer.optimize_content(
-                            effective_media_path, caption, "auto"
-                        )
-                    
-                    if optimization_result["success"]:
-                        optimized_media_path = optimization_result["optimized_media_path"]
-                        optimized_caption = optimization_result["optimized_caption"]
-                        
-                        # For YouTube, also get the optimized title
-                        if platform_lower in ['youtube', 'youtube_shorts'] and "optimized_title" in optimization_result:
-                            optimized_kwargs["title"] = optimization_result["optimized_title"]
-                        
-                        self.logger.info(f"Content optimized for {platform}: {optimization_result['metadata']}")
-                    else:
-                        self.logger.warning(f"Optimization failed for {platform}: {optimization_result['message']}")
+            # Apply platform-specific optimizations if enabled
+            optimized_media_paths = effective_media_paths
+            optimized_media_path = effective_media_path
+            optimized_caption = caption
+            optimized_kwargs = kwargs.copy()
+            
+            if optimize_content and effective_media_path:
+                optimizer = self.optimizer_factory.get_optimizer(platform_lower)
                 
-                # Post to the specific platform (support galleries where available)
-                if is_gallery and platform_lower in ['tiktok', 'pinterest']:
-                    # Platforms that support galleries/carousels
-                    success, message = self._post_gallery_to_platform(
-                        platform_lower, optimized_media_paths, optimized_caption, is_video, **optimized_kwargs
+                # Special handling for YouTube Shorts
+                is_short = platform_lower == 'youtube_shorts'
+                if platform_lower in ['youtube', 'youtube_shorts']:
+                    optimization_result = optimizer.optimize_content(
+                        effective_media_path, caption, "auto", is_short=is_short, **kwargs
                     )
                 else:
-                    # Single media post
-                    success, message = self._post_to_single_platform(
-                        platform_lower, optimized_media_path, optimized_caption, is_video, **optimized_kwargs
+                    optimization_result = optimizer.optimize_content(
+                        effective_media_path, caption, "auto"
                     )
                 
-                results[platform] = (success, message)
-                
-                # Small delay between posts to avoid rate limiting
-                if len(platforms) > 1:
-                    time.sleep(1)
+                if optimization_result["success"]:
+                    optimized_media_path = optimization_result["optimized_media_path"]
+                    optimized_caption = optimization_result["optimized_caption"]
+                    
+                    # For YouTube, also get the optimized title
+                    if platform_lower in ['youtube', 'youtube_shorts'] and "optimized_title" in optimization_result:
+                        optimized_kwargs["title"] = optimization_result["optimized_title"]
                     
-            except Exception as e:
-                error_msg = f"Error posting to {platform}: {str(e)}"
-                self.logger.exception(error_msg)
-                results[platform] = (False, error_msg)
+                    self.logger.info(f"Content optimized for {platform}: {optimization_result['metadata']}")
+                else:
+                    self.logger.warning(f"Optimization failed for {platform}: {optimization_result['message']}")
+            
+            # Post to the specific platform (support galleries where available)
+            if is_gallery and platform_lower in ['tiktok', 'pinterest']:
+                # Platforms that support galleries/carousels
+                return self._post_gallery_to_platform(
+                    platform_lower, optimized_media_paths, optimized_caption, is_video, **optimized_kwargs
+                )
+            
+            # Single media post
+            return self._post_to_single_platform(
+                platform_lower, optimized_media_path, optimized_caption, is_video, **optimized_kwargs
+            )
+        
+        results = self._post_concurrently(platforms, post_one)
         
         # Emit completion signal
         all_success = all(result[0] for result in results.values())
@@ -204,41 +358,76 @@ class UnifiedPostingHandler:
         
         return results
     
+    def _handler_for_platform(self, platform_lower: str) -> Optional[Any]:
+        """Get the API handler that posts to a platform, or None if the platform is unsupported."""
+        return self._platform_handlers.get(platform_lower)
+    
+    def _post_concurrently(self, platforms: List[str], 
+                           post_one: Callable[[str], Tuple[bool, str]]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Post to several platforms at once, with one thread per platform handler.
+        
+        Uploads are network-bound, so the total time is that of the slowest platform
+        rather than the sum of all of them. Platforms that share a handler (Instagram
+        and Facebook both go through Meta) are posted one after another on that
+        handler's thread, since the handlers are not safe to use concurrently;
+        their pacing comes from the handler's rate limiter.
+        
+        Args:
+            platforms: List of platform names to post to
+            post_one: Callable that posts to one platform and returns (success, message)
+            
+        Returns:
+            Dictionary mapping platform names to (success, message) tuples, in the order given
+        """
+        groups: Dict[int, List[str]] = {}
+        for platform in platforms:
+            handler = self._handler_for_platform(platform.lower())
+            groups.setdefault(id(handler), []).append(platform)
+        
+        def post_group(group: List[str]) -> Dict[str, Tuple[bool, str]]:
+            group_results = {}
+            for platform in group:
+                try:
+                    group_results[platform] = post_one(platform)
+                except Exception as e:
+                    error_msg = f"Error posting to {platform}: {str(e)}"
+                    self.logger.exception(error_msg)
+                    group_results[platform] = (False, error_msg)
+            return group_results
+        
+        posted = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(groups))) as executor:
+            for group_results in executor.map(post_group, groups.values()):
+                posted.update(group_results)
+        
+        return {platform: posted[platform] for platform in platforms}
+    
     def _post_to_single_platform(self, platform_lower: str, media_path: str, caption: str, 
                                 is_video: bool, **kwargs) -> Tuple[bool, str]:
         """Post to a single platform with the given parameters."""
-        if platform_lower in ['instagram', 'facebook']:
-            if platform_lower == 'instagram':
-                return self.meta_handler.post_to_instagram(media_path, caption, is_video)
-            else:  # facebook
-                return self.meta_handler.post_to_facebook(media_path, caption, is_video)
-        elif platform_lower == 'instagram_api':
-            return self.instagram_handler.post_media(media_path, caption, is_video)
-        elif platform_lower == 'tiktok':
-            return self.tiktok_handler.post_media(media_path=media_path, caption=caption, is_video=is_video)
-        elif platform_lower in ['google_business', 'google_my_business']:
-            return self.google_business_handler.post_media(media_path, caption, is_video)
-        elif platform_lower == 'bluesky':
-            return self.bluesky_handler.post_media(media_path, caption, is_video)
-        elif platform_lower == 'pinterest':
-            return self.pinterest_handler.post_media(media_path=media_path, caption=caption, is_video=is_video)
-        elif platform_lower == 'threads':
-            return self.threads_handler.post_media(media_path, caption, is_video)
-        elif platform_lower == 'youtube':
-            return self.youtube_handler.post_media(media_path, caption, is_video, is_short=False, **kwargs)
-        elif platform_lower == 'youtube_shorts':
-            return self.youtube_handler.post_media(media_path, caption, is_video, is_short=True, **kwargs)
-        else:
+        post = self._dispatch.get(platform_lower)
+        if post is None:
             return False, f"Unsupported platform: {platform_lower}"
+        self._wait_for_rate_limit(platform_lower)
+        return post(media_path, caption, is_video, **kwargs)
+    
+    def _wait_for_rate_limit(self, platform_lower: str):
+        """Block until the platform's handler may post again."""
+        rate_limiter = self._rate_limiters.get(self._handler_for_platform(platform_lower))
+        if rate_limiter is not None:
+            rate_limiter.acquire()
     
     def _post_gallery_to_platform(self, platform_lower: str, media_paths: List[str], caption: str, 
                                   is_video: bool, **kwargs) -> Tuple[bool, str]:
         """Post a gallery/carousel to platforms that support it."""
         if platform_lower == 'tiktok':
             # TikTok photo carousels (up to 35 images)
+            self._wait_for_rate_limit(platform_lower)
             return self.tiktok_handler.post_media(media_paths=media_paths, caption=caption, is_video=False, **kwargs)
         elif platform_lower == 'pinterest':
             # Pinterest gallery/carousel pins
+            self._wait_for_rate_limit(platform_lower)
             return self.pinterest_handler.post_media(media_paths=media_paths, caption=caption, is_video=is_video, **kwargs)
         else:
             # Fallback to single image for platforms that don't support galleries
@@ -258,26 +447,10 @@ class UnifiedPostingHandler:
         Returns:
             Dictionary mapping platform names to (success, message) tuples
         """
-        results = {}
-        
-        for platform in platforms:
-            platform_lower = platform.lower()
-            
-            try:
-                success, message = self._post_to_single_platform(
-                    platform_lower, media_path, caption, is_video
-                )
-                
-                results[platform] = (success, message)
-                
-                # Small delay between posts to avoid rate limiting
-                if len(platforms) > 1:
-                    time.sleep(1)
-                    
-            except Exception as e:
-                error_msg = f"Error posting to {platform}: {str(e)}"
-                self.logger.exception(error_msg)
-                results[platform] = (False, error_msg)
+        results = self._post_concurrently(
+            platforms,
+            lambda platform: self._post_to_single_platform(platform.lower(), media_path, caption, is_video)
+        )
         
         # Emit completion signal
         all_success = all(result[0] for result in results.values())
@@ -287,14 +460,15 @@ class UnifiedPostingHandler:
     
     def get_available_platforms(self) -> Dict[str, bool]:
         """Get availability status for all platforms."""
-        meta_status = self.meta_handler.get_posting_status()
-        instagram_status = self.instagram_handler.get_posting_status()
-        tiktok_status = self.tiktok_handler.get_posting_status()
-        google_business_status = self.google_business_handler.get_posting_status()
-        bluesky_status = self.bluesky_handler.get_posting_status()
-        pinterest_status = self.pinterest_handler.get_posting_status()
-        threads_status = self.threads_handler.get_posting_status()
-        youtube_status = self.youtube_handler.get_posting_status()
+        statuses = self._get_platform_statuses()
+        meta_status = statuses['meta']
+        instagram_status = statuses['instagram']
+        tiktok_status = statuses['tiktok']
+        google_business_status = statuses['google_business']
+        bluesky_status = statuses['bluesky']
+        pinterest_status = statuses['pinterest']
+        threads_status = statuses['threads']
+        youtube_status = statuses['youtube']
         
         return {
             'instagram': meta_status.get('instagram_available', False),
@@ -311,13 +485,14 @@ class UnifiedPostingHandler:
     
     def get_platform_errors(self) -> Dict[str, str]:
         """Get error messages for unavailable platforms."""
-        meta_status = self.meta_handler.get_posting_status()
-        instagram_status = self.instagram_handler.get_posting_status()
-        tiktok_status = self.tiktok_handler.get_posting_status()
-        google_business_status = self.google_business_handler.get_posting_status()
-        bluesky_status = self.bluesky_handler.get_posting_status()
-        pinterest_status = self.pinterest_handler.get_posting_status()
-        threads_status = self.threads_handler.get_posting_status()
+        statuses = self._get_platform_statuses()
+        meta_status = statuses['meta']
+        instagram_status = statuses['instagram']
+        tiktok_status = statuses['tiktok']
+        google_business_status = statuses['google_business']
+        bluesky_status = statuses['bluesky']
+        pinterest_status = statuses['pinterest']
+        threads_status = statuses['threads']
         
         errors = {}
         
@@ -349,100 +524,35 @@ class UnifiedPostingHandler:
         """Validate media file for specific platforms."""
         results = {}
         
+        # Probe the file once up front rather than letting every platform's
+        # validator find out it is missing
+        media_exists = os.path.isfile(media_path)
+        
+        # Validation depends only on the handler, so platforms that share one
+        # (Instagram and Facebook via Meta) reuse its answer
+        handler_results = {}
+        
         for platform in platforms:
             platform_lower = platform.lower()
+            handler = self._handler_for_platform(platform_lower)
             
-            if platform_lower in ['instagram', 'facebook']:
-                success, message = self.meta_handler.validate_media_file(media_path)
-
-            elif platform_lower == 'instagram_api':
-                success, message = self.instagram_handler.validate_media_file(media_path)
-            elif platform_lower == 'tiktok':
-                success, message = self.tiktok_handler.validate_media_file(media_path)
-            elif platform_lower in ['google_business', 'google_my_business']:
-                success, message = self.google_business_handler.validate_media_file(media_path)
-            elif platform_lower == 'bluesky':
-                success, message = self.bluesky_handler.validate_media_file(media_path)
-            elif platform_lower == 'pinterest':
-                success, message = self.pinterest_handler.validate_media_file(media_path)
-            elif platform_lower == 'threads':
-                success, message = self.threads_handler.validate_media_file(media_path)
-            else:
+            if handler is None or handler is self.youtube_handler:
                 success, message = False, f"Unsupported platform: {platform}"
+            elif not media_exists:
+                success, message = False, "Media file does not exist"
+            else:
+                if handler not in handler_results:
+                    handler_results[handler] = handler.validate_media_file(media_path)
+                success, message = handler_results[handler]
             
             results[platform] = (success, message)
         
         return results
     
-    def get_platform_limits(self) -> Dict[str, Dict[str, Any]]:
-        """Get posting limits for each platform."""
-        return {
-            'instagram': {
-                'max_caption_length': 2200,
-                'max_image_size': 8 * 1024 * 1024,  # 8MB
-                'max_video_size': 100 * 1024 * 1024,  # 100MB
-                'max_video_duration': 60,  # seconds
-                'requires_media': True
-            },
-            'facebook': {
-                'max_caption_length': 63206,
-                'max_image_size': 8 * 1024 * 1024,  # 8MB
-                'max_video_size': 100 * 1024 * 1024,  # 100MB
-                'max_video_duration': 240,  # seconds
-                'requires_media': False
-            },
+    def get_platform_limits(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get posting limits for each platform, as a read-only mapping."""
+        return PLATFORM_LIMITS
 
-            'instagram_api': {
-                'max_caption_length': 2200,
-                'max_image_size': 8 * 1024 * 1024,  # 8MB
-                'max_video_size': 100 * 1024 * 1024,  # 100MB
-                'max_video_duration': 60,  # seconds
-                'requires_media': True
-            },
-            'tiktok': {
-                'max_caption_length': 2200,
-                'max_image_size': 20 * 1024 * 1024,  # 20MB per image
-                'max_video_size': 4 * 1024 * 1024 * 1024,  # 4GB
-                'max_video_duration': 600,  # 10 minutes
-                'max_carousel_images': 35,  # Photo carousels supported
-                'requires_media': True,
-                'supports_photo_carousel': True,
-                'supports_video': True
-            },
-            'google_business': {
-                'max_caption_length': 1500,
-                'max_image_size': 10 * 1024 * 1024,  # 10MB
-                'max_video_size': 100 * 1024 * 1024,  # 100MB
-                'max_video_duration': 30,  # seconds
-                'requires_media': False
-            },
-            'bluesky': {
-                'max_caption_length': 300,
-                'max_image_size': 1 * 1024 * 1024,  # 1MB
-                'max_video_size': 0,  # No video support
-                'max_video_duration': 0,
-                'requires_media': False,
-                'image_only': True
-            },
-            'pinterest': {
-                'max_caption_length': 500,
-                'max_image_size': 32 * 1024 * 1024,  # 32MB
-                'max_video_size': 2 * 1024 * 1024 * 1024,  # 2GB
-                'max_video_duration': 900,  # 15 minutes
-                'max_carousel_images': 5,  # Gallery/carousel pins supported
-                'requires_media': True,
-                'supports_gallery': True,
-                'supports_carousel': True,
-                'supports_boards': True
-            },
-            'threads': {
-                'max_caption_length': 500,
-                'max_image_size': 8 * 1024 * 1024,  # 8MB
-                'max_video_size': 100 * 1024 * 1024,  # 100MB
-                'max_video_duration': 60,  # seconds
-                'requires_media': False
-            }
-        }
 
 class UnifiedPostingWorker(QThread):
     """Worker thread for unified posting operations."""
@@ -470,51 +580,12 @@ class UnifiedPostingWorker(QThread):
                 self.progress.emit(f"Posting to {platform}...", 
                                  int((i / total_platforms) * 100))
                 
-                platform_lower = platform.lower()
-                
-                if platform_lower in ['instagram', 'facebook']:
-                    if platform_lower == 'instagram':
-                        success, message = self.handler.meta_handler.post_to_instagram(
-                            self.media_path, self.caption, self.is_video
-                        )
-                    else:  # facebook
-                        success, message = self.handler.meta_handler.post_to_facebook(
-                            self.media_path, self.caption, self.is_video
-                        )
-
-                elif platform_lower == 'instagram_api':
-                    success, message = self.handler.instagram_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                elif platform_lower == 'tiktok':
-                    success, message = self.handler.tiktok_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                elif platform_lower in ['google_business', 'google_my_business']:
-                    success, message = self.handler.google_business_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                elif platform_lower == 'bluesky':
-                    success, message = self.handler.bluesky_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                elif platform_lower == 'pinterest':
-                    success, message = self.handler.pinterest_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                elif platform_lower == 'threads':
-                    success, message = self.handler.threads_handler.post_media(
-                        self.media_path, self.caption, self.is_video
-                    )
-                else:
-                    success, message = False, f"Unsupported platform: {platform}"
+                success, message = self.handler._post_to_single_platform(
+                    platform.lower(), self.media_path, self.caption, self.is_video
+                )
                 
                 results[platform] = (success, message)
                 self.platform_complete.emit(platform, success, message)
-                
-                # Small delay between posts
-                if i < total_platforms - 1:
-                    time.sleep(1)
             
             self.progress.emit("All posts complete", 100)
             all_success = all(result[0] for result in results.values())
@@ -0,0 +1,72 @@
+"""
+JPEG encoding utility for video frames.
+Uses libjpeg-turbo through PyTurboJPEG when available, falling back to OpenCV.
+"""
+import logging
+import threading
+from typing import Optional
+import cv2
+import numpy as np
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_RGB
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_turbo_jpeg = None
+_turbo_jpeg_lock = threading.Lock()
+
+
+def _get_turbo_jpeg() -> Optional["TurboJPEG"]:
+    """
+    Get the shared TurboJPEG encoder, creating it on first use.
+
+    Frames are encoded from several threads at once, so creation is done under a
+    lock to load the native library (or give up on it) exactly once.
+
+    Returns:
+        TurboJPEG instance, or None if PyTurboJPEG or the native library is missing
+    """
+    global _turbo_jpeg, TURBOJPEG_AVAILABLE
+
+    if _turbo_jpeg is None and TURBOJPEG_AVAILABLE:
+        with _turbo_jpeg_lock:
+            # Another thread may have finished, or given up on, the setup while this one waited
+            if _turbo_jpeg is None and TURBOJPEG_AVAILABLE:
+                try:
+                    _turbo_jpeg = TurboJPEG()
+                except (OSError, RuntimeError) as e:
+                    # The Python package is installed but libjpeg-turbo itself is not
+                    logger.warning(f"libjpeg-turbo not available, using OpenCV for JPEG encoding: {e}")
+                    TURBOJPEG_AVAILABLE = False
+
+    return _turbo_jpeg
+
+
+def encode_jpeg(frame: np.ndarray, quality: int = 90, rgb: bool = False) -> bytes:
+    """
+    Encode a video frame as JPEG bytes.
+
+    Args:
+        frame: HxWx3 uint8 frame
+        quality: JPEG quality (1-100)
+        rgb: True if the frame is in RGB order (MoviePy), False for BGR (OpenCV)
+
+    Returns:
+        bytes: Encoded JPEG data
+    """
+    turbo_jpeg = _get_turbo_jpeg()
+    if turbo_jpeg is not None:
+        return turbo_jpeg.encode(frame, quality=quality, pixel_format=TJPF_RGB if rgb else TJPF_BGR)
+
+    if rgb:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+    success, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not success:
+        raise ValueError("Could not encode frame as JPEG")
+
+    return buffer.tobytes()
@@ -3,21 +3,26 @@ Video Thumbnail Generator - Utility for creating thumbnails from video files.
 """
 import os
 import logging
-import tempfile
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 import cv2
 from PIL import Image
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtCore import Qt
 
+# Number of generated thumbnails (or thumbnail strips) kept in memory
+THUMBNAIL_CACHE_SIZE = 128
+
 
 class VideoThumbnailGenerator:
     """Utility class for generating video thumbnails."""
     
+    # Shared by all instances, since every thumbnail widget creates its own generator
+    _thumbnail_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+    
     def __init__(self):
         """Initialize the thumbnail generator."""
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.temp_dir = tempfile.gettempdir()
     
     def generate_thumbnail(self, video_path: str, timestamp: float = 1.0, 
                           size: Tuple[int, int] = (400, 300)) -> Optional[QPixmap]:
@@ -37,6 +42,11 @@ class VideoThumbnailGenerator:
                 self.logger.warning(f"Video file not found: {video_path}")
                 return None
             
+            cache_key = self._cache_key(video_path, "single", timestamp, size)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
             # Open video with OpenCV
             cap = cv2.VideoCapture(video_path)
             if not cap.isOpened():
@@ -52,54 +62,14 @@ class VideoThumbnailGenerator:
             if timestamp > duration:
                 timestamp = duration * 0.1  # Use 10% into the video
             
-            # Seek to the desired timestamp
-            frame_number = int(timestamp * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            
-            # Read the frame
-            ret, frame = cap.read()
+            # Seek to the desired timestamp and read the frame
+            pixmap = self._read_thumbnail(cap, fps, timestamp, size)
             cap.release()
             
-            if not ret or frame is None:
-                self.logger.error(f"Could not read frame at timestamp {timestamp}")
-                return None
-            
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image
-            pil_image = Image.fromarray(frame_rgb)
-            
-            # Resize to desired size while maintaining aspect ratio
-            pil_image.thumbnail(size, Image.Resampling.LANCZOS)
-            
-            # Create a new image with the exact size and center the thumbnail
-            final_image = Image.new('RGB', size, (0, 0, 0))
-            
-            # Calculate position to center the thumbnail
-            x = (size[0] - pil_image.width) // 2
-            y = (size[1] - pil_image.height) // 2
-            
-            final_image.paste(pil_image, (x, y))
-            
-            # Convert to QPixmap
-            # Save to temporary file first
-            temp_path = os.path.join(self.temp_dir, f"video_thumb_{os.getpid()}.png")
-            final_image.save(temp_path, "PNG")
-            
-            # Load as QPixmap
-            pixmap = QPixmap(temp_path)
-            
-            # Clean up temporary file
-            try:
-                os.remove(temp_path)
-            except:
-                pass  # Ignore cleanup errors
-            
-            if pixmap.isNull():
-                self.logger.error("Failed to create QPixmap from thumbnail")
+            if pixmap is None:
                 return None
             
+            self._put_cached(cache_key, pixmap)
             self.logger.info(f"Generated thumbnail for {os.path.basename(video_path)}")
             return pixmap
             
@@ -107,6 +77,88 @@ class VideoThumbnailGenerator:
             self.logger.exception(f"Error generating thumbnail for {video_path}: {e}")
             return None
     
+    def _cache_key(self, video_path: str, *args) -> tuple:
+        """
+        Build a thumbnail cache key that changes whenever the video file does.
+        
+        Args:
+            video_path: Path to the video file
+            *args: Request parameters that affect the result
+            
+        Returns:
+            Tuple identifying the file version and request
+        """
+        stat = os.stat(video_path)
+        return (os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size) + args
+    
+    def _get_cached(self, cache_key: tuple) -> Optional[Any]:
+        """Return a cached thumbnail result, marking it as recently used."""
+        cached = self._thumbnail_cache.get(cache_key)
+        if cached is not None:
+            self._thumbnail_cache.move_to_end(cache_key)
+        return cached
+    
+    def _put_cached(self, cache_key: tuple, value: Any):
+        """Store a thumbnail result, evicting the least recently used one if full."""
+        self._thumbnail_cache[cache_key] = value
+        self._thumbnail_cache.move_to_end(cache_key)
+        if len(self._thumbnail_cache) > THUMBNAIL_CACHE_SIZE:
+            self._thumbnail_cache.popitem(last=False)
+    
+    def _read_thumbnail(self, cap: cv2.VideoCapture, fps: float, timestamp: float,
+                        size: Tuple[int, int]) -> Optional[QPixmap]:
+        """
+        Read the frame at a timestamp from an open capture and turn it into a thumbnail.
+        
+        Args:
+            cap: Open OpenCV video capture
+            fps: Frame rate of the video
+            timestamp: Time in seconds to capture the frame
+            size: Tuple of (width, height) for the thumbnail size
+            
+        Returns:
+            QPixmap object if successful, None otherwise
+        """
+        # Seek to the desired timestamp
+        frame_number = int(timestamp * fps)
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+        
+        # Read the frame
+        ret, frame = cap.read()
+        
+        if not ret or frame is None:
+            self.logger.error(f"Could not read frame at timestamp {timestamp}")
+            return None
+        
+        # Convert BGR to RGB
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        
+        # Convert to PIL Image
+        pil_image = Image.fromarray(frame_rgb)
+        
+        # Resize to desired size while maintaining aspect ratio
+        pil_image.thumbnail(size, Image.Resampling.LANCZOS)
+        
+        # Create a new image with the exact size and center the thumbnail
+        final_image = Image.new('RGB', size, (0, 0, 0))
+        
+        # Calculate position to center the thumbnail
+        x = (size[0] - pil_image.width) // 2
+        y = (size[1] - pil_image.height) // 2
+        
+        final_image.paste(pil_image, (x, y))
+        
+        # Convert to QPixmap straight from the RGB pixel buffer; no temp file or PNG encode
+        rgb_data = final_image.tobytes()
+        qimage = QImage(rgb_data, size[0], size[1], size[0] * 3, QImage.Format.Format_RGB888)
+        pixmap = QPixmap.fromImage(qimage)
+        
+        if pixmap.isNull():
+            self.logger.error("Failed to create QPixmap from thumbnail")
+            return None
+        
+        return pixmap
+    
     def generate_multiple_thumbnails(self, video_path: str, count: int = 3, 
                                    size: Tuple[int, int] = (200, 150)) -> list:
         """
@@ -126,6 +178,11 @@ class VideoThumbnailGenerator:
             if not os.path.exists(video_path):
                 return thumbnails
             
+            cache_key = self._cache_key(video_path, "multiple", count, size)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return list(cached)
+            
             # Get video duration
             cap = cv2.VideoCapture(video_path)
             if not cap.isOpened():
@@ -134,9 +191,9 @@ class VideoThumbnailGenerator:
             fps = cap.get(cv2.CAP_PROP_FPS)
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
             duration = total_frames / fps if fps > 0 else 0
-            cap.release()
             
             if duration <= 0:
+                cap.release()
                 return thumbnails
             
             # Generate timestamps evenly distributed across the video
@@ -149,11 +206,18 @@ class VideoThumbnailGenerator:
                     progress = 0.1 + (0.8 * i / (count - 1))
                     timestamps.append(duration * progress)
             
-            # Generate thumbnail for each timestamp
-            for timestamp in timestamps:
-                thumbnail = self.generate_thumbnail(video_path, timestamp, size)
-                if thumbnail:
-                    thumbnails.append(thumbnail)
+            # Generate thumbnail for each timestamp from the same capture,
+            # seeking forward in temporal order instead of reopening the file
+            try:
+                for timestamp in timestamps:
+                    thumbnail = self._read_thumbnail(cap, fps, timestamp, size)
+                    if thumbnail:
+                        thumbnails.append(thumbnail)
+            finally:
+                cap.release()
+            
+            if thumbnails:
+                self._put_cached(cache_key, list(thumbnails))
             
         except Exception as e:
             self.logger.exception(f"Error generating multiple thumbnails: {e}")
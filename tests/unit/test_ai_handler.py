@@ -0,0 +1,359 @@
+"""
+Unit tests for the caching and batching paths of AIHandler.
+"""
+
+import io
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.api.ai import ai_handler as ai_module
+from src.api.ai.ai_handler import AIHandler
+
+
+class FakeResponse:
+    """Minimal stand-in for a Gemini response."""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeVisionModel:
+    """Gemini vision model double that labels every analysis with its request number."""
+
+    def __init__(self):
+        self.requests = []
+
+    def generate_content(self, contents):
+        self.requests.append(contents)
+        images = [part for part in contents if isinstance(part, dict)]
+        label = f"request {len(self.requests)}"
+        if len(images) > 1:
+            return FakeResponse(json.dumps([{"main_subject": f"{label} frame {i}"} for i in range(len(images))]))
+        return FakeResponse(json.dumps({"main_subject": label}))
+
+
+@pytest.fixture
+def handler(monkeypatch, tmp_path):
+    """AIHandler with a fake vision model and its caches pointed at tmp_path."""
+    monkeypatch.setattr(ai_module.const, "CACHE_ENABLED", False)
+    monkeypatch.setattr(ai_module.const, "ANALYSIS_CACHE_DIR", str(tmp_path / "analysis"))
+
+    ai_handler = AIHandler(None)
+    ai_handler.vision_model = FakeVisionModel()
+    return ai_handler
+
+
+def write_video(path, marker_value):
+    """Write a short static video; marker_value only changes a tiny corner patch."""
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    frame[:, :, 0] = np.linspace(0, 255, 320, dtype=np.uint8)
+    cv2.rectangle(frame, (100, 60), (220, 180), (255, 255, 255), -1)
+    frame[:4, :4] = marker_value
+
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10, (320, 240))
+    for _ in range(20):
+        writer.write(frame)
+    writer.release()
+
+
+def test_near_identical_frames_of_different_videos_do_not_share_analyses(handler, tmp_path):
+    first_video = tmp_path / "first.mp4"
+    second_video = tmp_path / "second.mp4"
+    write_video(first_video, 0)
+    write_video(second_video, 255)
+
+    # The two videos are different files whose key frames hash within the match distance
+    first_frame = handler._extract_key_frames(str(first_video))[0]
+    second_frame = handler._extract_key_frames(str(second_video))[0]
+    _, first_hash = handler._frame_signature(first_frame)
+    _, second_hash = handler._frame_signature(second_frame)
+    assert (first_hash ^ second_hash).bit_count() <= ai_module.FRAME_HASH_MAX_DISTANCE
+
+    first = handler._analyze_video_content(str(first_video))
+    second = handler._analyze_video_content(str(second_video))
+
+    assert len(handler.vision_model.requests) == 2
+    first_subjects = {sample["analysis"]["main_subject"] for sample in first["frame_samples"]}
+    second_subjects = {sample["analysis"]["main_subject"] for sample in second["frame_samples"]}
+    assert first_subjects == {"request 1"}
+    assert second_subjects == {"request 2"}
+
+
+class BatchFailingVisionModel:
+    """Vision model double whose batched replies can't be used; single frames echo their bytes."""
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.requests = []
+
+    def generate_content(self, contents):
+        self.requests.append(contents)
+        images = [part for part in contents if isinstance(part, dict)]
+        if len(images) > 1:
+            return FakeResponse(self.batch_reply)
+        return FakeResponse(json.dumps({"main_subject": images[0]["data"].decode()}))
+
+
+@pytest.mark.parametrize("reply", [
+    'Here are the analyses you asked for:\n[{"main_subject": "cake"}, {"main_subject": "bread"}]\nLet me know!',
+    '```json\n[{"main_subject": "cake"}, {"main_subject": "bread"}]\n```',
+    'Sure.\n```json\n[{"main_subject": "cake"}, {"main_subject": "bread"}]\n```',
+])
+def test_parse_batch_content_analysis_extracts_wrapped_array(handler, reply):
+    assert handler._parse_batch_content_analysis(reply, 2) == [
+        {"main_subject": "cake"},
+        {"main_subject": "bread"},
+    ]
+
+
+def test_parse_batch_content_analysis_rejects_wrong_element_count(handler):
+    reply = '[{"main_subject": "cake"}, {"main_subject": "bread"}]'
+
+    assert handler._parse_batch_content_analysis(reply, 3) is None
+    assert handler._parse_batch_content_analysis('[{"main_subject": "cake"}, "bread"]', 2) is None
+
+
+def test_parse_batch_content_analysis_rejects_invalid_json(handler):
+    assert handler._parse_batch_content_analysis('[{"main_subject": "cake"},]', 1) is None
+    assert handler._parse_batch_content_analysis("I could not analyze these images.", 1) is None
+
+
+@pytest.mark.parametrize("batch_reply", [
+    '[{"main_subject": "cake"},]',
+    '[{"main_subject": "cake"}]',
+])
+def test_unusable_batch_reply_falls_back_to_per_frame_requests(handler, batch_reply):
+    handler.vision_model = BatchFailingVisionModel(batch_reply)
+    frames = [b"frame 0", b"frame 1", b"frame 2"]
+
+    analyses, prompt = handler._analyze_frames_with_gemini(frames)
+
+    # One batched attempt, then one request per frame, with results in frame order
+    assert len(handler.vision_model.requests) == 1 + len(frames)
+    assert [analysis["main_subject"] for analysis in analyses] == ["frame 0", "frame 1", "frame 2"]
+    assert prompt == ai_module.CONTENT_ANALYSIS_PROMPT
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    """Enable the on-disk analysis cache inside tmp_path and return its directory."""
+    cache_dir = tmp_path / "analysis"
+    monkeypatch.setattr(ai_module.const, "CACHE_ENABLED", True)
+    monkeypatch.setattr(ai_module.const, "ANALYSIS_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def counting_analysis(result):
+    """Return an analyze callable and the list its calls are recorded in."""
+    calls = []
+
+    def analyze():
+        calls.append(1)
+        return dict(result)
+
+    return analyze, calls
+
+
+def test_disk_cache_hit_skips_analysis(handler, disk_cache):
+    analyze, calls = counting_analysis({"main_subject": "cake"})
+
+    first = handler._cached_analysis(b"image bytes", "prompt", analyze)
+    second = handler._cached_analysis(b"image bytes", "prompt", analyze)
+
+    assert first == second == {"main_subject": "cake"}
+    assert len(calls) == 1
+    assert [path.suffix for path in disk_cache.iterdir()] == [".json"]
+
+
+def test_disk_cache_entry_expires_after_ttl(handler, disk_cache):
+    analyze, calls = counting_analysis({"main_subject": "cake"})
+    handler._cached_analysis(b"image bytes", "prompt", analyze)
+
+    cache_path = handler._analysis_cache_path(b"image bytes", "prompt")
+    expired = time.time() - ai_module.const.ANALYSIS_CACHE_TTL - 1
+    os.utime(cache_path, (expired, expired))
+
+    assert handler._load_cached_analysis(cache_path) is None
+    assert not os.path.exists(cache_path)
+    handler._cached_analysis(b"image bytes", "prompt", analyze)
+    assert len(calls) == 2
+
+
+def write_aged_entries(handler, ages):
+    """Write a cache entry for each content in ages with that modification time."""
+    for content, mtime in ages.items():
+        handler._store_cached_analysis(handler._analysis_cache_path(content, "prompt"), {"main_subject": "cake"})
+        os.utime(handler._analysis_cache_path(content, "prompt"), (mtime, mtime))
+
+
+def cached_contents(handler, disk_cache, contents):
+    """Which of contents still have an entry in the cache directory."""
+    names = {path.name for path in disk_cache.iterdir()}
+    return {content for content in contents
+            if os.path.basename(handler._analysis_cache_path(content, "prompt")) in names}
+
+
+def test_disk_cache_write_prunes_expired_entries(handler, disk_cache):
+    now = time.time()
+    ages = {b"expired": now - ai_module.const.ANALYSIS_CACHE_TTL - 1, b"recent": now - 10}
+    write_aged_entries(handler, ages)
+
+    handler._cached_analysis(b"newest", "prompt", counting_analysis({"main_subject": "cake"})[0])
+
+    assert cached_contents(handler, disk_cache, [*ages, b"newest"]) == {b"recent", b"newest"}
+
+
+def test_disk_cache_write_prunes_oldest_entries_beyond_max_size(handler, disk_cache, monkeypatch):
+    now = time.time()
+    ages = {b"oldest": now - 40, b"older": now - 30, b"newer": now - 20}
+    write_aged_entries(handler, ages)
+    monkeypatch.setattr(ai_module.const, "CACHE_MAX_SIZE", 3)
+
+    handler._cached_analysis(b"newest", "prompt", counting_analysis({"main_subject": "cake"})[0])
+
+    assert cached_contents(handler, disk_cache, [*ages, b"newest"]) == {b"older", b"newer", b"newest"}
+
+
+def test_corrupt_disk_cache_entry_is_ignored_and_replaced(handler, disk_cache):
+    cache_path = handler._analysis_cache_path(b"image bytes", "prompt")
+    disk_cache.mkdir()
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write('{"main_subject": "ca')
+
+    analyze, calls = counting_analysis({"main_subject": "cake"})
+
+    assert handler._load_cached_analysis(cache_path) is None
+    assert handler._cached_analysis(b"image bytes", "prompt", analyze) == {"main_subject": "cake"}
+    assert len(calls) == 1
+    assert handler._load_cached_analysis(cache_path) == {"main_subject": "cake"}
+
+
+def test_disk_cache_does_not_store_errors(handler, disk_cache):
+    analyze, calls = counting_analysis({"content_description": "failed", "error": "timeout"})
+
+    handler._cached_analysis(b"image bytes", "prompt", analyze)
+    handler._cached_analysis(b"image bytes", "prompt", analyze)
+
+    assert len(calls) == 2
+    assert not disk_cache.exists() or not list(disk_cache.iterdir())
+
+
+def test_disk_cache_key_depends_on_content_and_prompt(handler, disk_cache):
+    key = handler._analysis_cache_path(b"image bytes", "prompt")
+
+    assert handler._analysis_cache_path(b"image bytes", "prompt") == key
+    assert handler._analysis_cache_path(b"other bytes", "prompt") != key
+    assert handler._analysis_cache_path(b"image bytes", "other prompt") != key
+
+
+def test_disk_cache_disabled_has_no_key(handler, monkeypatch):
+    monkeypatch.setattr(ai_module.const, "CACHE_ENABLED", False)
+
+    assert handler._analysis_cache_path(b"image bytes", "prompt") is None
+
+
+def write_changing_video(path):
+    """Write a short video whose content changes completely every few frames."""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 10, (320, 240))
+    for i in range(40):
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        scene = i // 8
+        frame[:, :, scene % 3] = np.linspace(0, 255, 320, dtype=np.uint8)
+        cv2.circle(frame, (40 + scene * 60, 60 + (scene % 2) * 120), 40, (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def test_batched_frame_analyses_are_cached_under_the_batch_prompt(handler, disk_cache, tmp_path):
+    video = tmp_path / "scenes.mp4"
+    write_changing_video(video)
+
+    analysis = handler._analyze_video_content(str(video))
+    assert len(handler.vision_model.requests) == 1
+    assert len(analysis["frame_samples"]) > 1
+
+    # Every entry written is keyed by the batch prompt, not the single-image prompt
+    batch_keys = set()
+    for frame in handler._extract_key_frames(str(video)):
+        image_data = ai_module.encode_jpeg(frame, ai_module.GEMINI_JPEG_QUALITY)
+        cache_path = handler._analysis_cache_path(image_data, ai_module.BATCH_CONTENT_ANALYSIS_PROMPT)
+        batch_keys.add(os.path.basename(cache_path))
+    written = {path.name for path in disk_cache.iterdir()}
+    assert written and written <= batch_keys
+
+    # A fresh handler finds every frame on disk and makes no requests
+    fresh = AIHandler(None)
+    fresh.vision_model = FakeVisionModel()
+    assert fresh._analyze_video_content(str(video))["frame_samples"] == analysis["frame_samples"]
+    assert fresh.vision_model.requests == []
+
+
+def test_keyless_placeholder_analyses_are_not_cached(handler, disk_cache, tmp_path):
+    video = tmp_path / "scenes.mp4"
+    write_changing_video(video)
+    handler.vision_model = None
+
+    placeholder = handler._analyze_video_content(str(video))
+    assert {sample["analysis"]["content_description"] for sample in placeholder["frame_samples"]} == {
+        "Image content (Gemini API key not provided)"
+    }
+    assert not disk_cache.exists() or not list(disk_cache.iterdir())
+
+    # Once a key is set the frames are analyzed for real, and only those results are cached
+    handler.vision_model = FakeVisionModel()
+    analysis = handler._analyze_video_content(str(video))
+    assert len(handler.vision_model.requests) == 1
+    assert analysis["frame_samples"] != placeholder["frame_samples"]
+
+    fresh = AIHandler(None)
+    fresh.vision_model = FakeVisionModel()
+    assert fresh._analyze_video_content(str(video))["frame_samples"] == analysis["frame_samples"]
+    assert fresh.vision_model.requests == []
+
+
+def write_rotated_jpeg(path, size):
+    """Write a landscape JPEG tagged as taken with the camera turned 90 degrees clockwise."""
+    image = Image.new("RGB", size, (200, 30, 30))
+    exif = Image.Exif()
+    exif[ai_module.EXIF_ORIENTATION_TAG] = 6
+    image.save(path, "JPEG", exif=exif)
+
+
+def uploaded_image_size(vision_model):
+    """Decode the single image the vision model was sent and return its size."""
+    images = [part for part in vision_model.requests[-1] if isinstance(part, dict)]
+    with Image.open(io.BytesIO(images[0]["data"])) as uploaded:
+        assert uploaded.getexif().get(ai_module.EXIF_ORIENTATION_TAG, 1) == 1
+        return uploaded.size
+
+
+@pytest.mark.parametrize("size", [(2000, 1000), (600, 300)])
+def test_image_upload_applies_exif_orientation(handler, tmp_path, size):
+    photo = tmp_path / "portrait.jpg"
+    write_rotated_jpeg(photo, size)
+
+    handler._analyze_image_content_with_gemini(str(photo))
+
+    # Stored landscape but shot in portrait, so Gemini must receive a portrait image
+    width, height = uploaded_image_size(handler.vision_model)
+    assert height > width
+    assert max(width, height) <= ai_module.GEMINI_MAX_IMAGE_DIMENSION
+
+
+@pytest.mark.parametrize("instructions, keyword", [
+    ("Post for the holidays", "Holiday"),
+    ("Weekend sales on all bread", "Sale"),
+    ("Our specials this week", "Special"),
+    ("Summertime treats", "Summer"),
+])
+def test_sample_caption_matches_seasonal_keywords_inside_words(handler, instructions, keyword):
+    caption = handler._generate_sample_caption(instructions, "")
+
+    assert f"Ideal for your {keyword} needs!" in caption
+    assert f"#{keyword}" in caption.split("\n\n")[-1].split()
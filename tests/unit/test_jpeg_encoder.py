@@ -0,0 +1,84 @@
+"""
+Unit tests for the shared JPEG encoder.
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.utils import jpeg_encoder
+
+
+@pytest.fixture
+def fresh_encoder(monkeypatch):
+    """Reset the lazily created encoder and make the PyTurboJPEG package look installed."""
+    monkeypatch.setattr(jpeg_encoder, "_turbo_jpeg", None)
+    monkeypatch.setattr(jpeg_encoder, "TURBOJPEG_AVAILABLE", True)
+
+
+def call_from_threads(function, count=8):
+    """Call function from several threads released at the same moment."""
+    barrier = threading.Barrier(count)
+    results = []
+
+    def run():
+        barrier.wait()
+        results.append(function())
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_turbo_jpeg_is_created_once_across_threads(fresh_encoder, monkeypatch):
+    created = []
+
+    class SlowTurboJPEG:
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.05)
+
+    monkeypatch.setattr(jpeg_encoder, "TurboJPEG", SlowTurboJPEG, raising=False)
+
+    results = call_from_threads(jpeg_encoder._get_turbo_jpeg)
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+def test_missing_native_library_is_reported_once_across_threads(fresh_encoder, monkeypatch, caplog):
+    attempts = []
+
+    def missing_library():
+        attempts.append(1)
+        time.sleep(0.05)
+        raise OSError("libturbojpeg.so.0: cannot open shared object file")
+
+    monkeypatch.setattr(jpeg_encoder, "TurboJPEG", missing_library, raising=False)
+
+    results = call_from_threads(jpeg_encoder._get_turbo_jpeg)
+
+    assert attempts == [1]
+    assert results == [None] * len(results)
+    assert len([record for record in caplog.records if "libjpeg-turbo not available" in record.message]) == 1
+    assert jpeg_encoder.TURBOJPEG_AVAILABLE is False
+
+
+def test_encode_jpeg_falls_back_to_opencv(monkeypatch):
+    monkeypatch.setattr(jpeg_encoder, "_turbo_jpeg", None)
+    monkeypatch.setattr(jpeg_encoder, "TURBOJPEG_AVAILABLE", False)
+    frame = np.zeros((16, 24, 3), dtype=np.uint8)
+    frame[:, :, 2] = 255
+
+    data = jpeg_encoder.encode_jpeg(frame, 90, rgb=True)
+
+    decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == (16, 24, 3)
+    # Blue in RGB order comes back as blue in OpenCV's BGR order
+    assert decoded[8, 12, 0] > 200 and decoded[8, 12, 2] < 50
@@ -0,0 +1,248 @@
+"""
+Unit tests for UnifiedPostingHandler, using stub platform handlers.
+"""
+
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+from src.features.posting import unified_posting_handler as posting_module
+from src.features.posting.unified_posting_handler import TokenBucket, UnifiedPostingHandler
+
+HANDLER_CLASSES = (
+    "MetaPostingHandler",
+    "InstagramAPIHandler",
+    "TikTokAPIHandler",
+    "GoogleBusinessAPIHandler",
+    "BlueSkyAPIHandler",
+    "PinterestAPIHandler",
+    "ThreadsAPIHandler",
+    "YouTubeAPIHandler",
+)
+
+
+class StubSignals(QObject):
+    """The signals every platform handler exposes."""
+    upload_started = Signal(str)
+    upload_progress = Signal(str, int)
+    upload_success = Signal(str, dict)
+    upload_error = Signal(str, str)
+    status_update = Signal(str)
+
+
+class StubHandler:
+    """Platform handler double that records each post with its start and end time."""
+
+    def __init__(self):
+        self.signals = StubSignals()
+        self.delay = 0.0
+        self.posts = []
+        self._lock = threading.Lock()
+
+    def _post(self, name, media_path, caption):
+        start = time.monotonic()
+        time.sleep(self.delay)
+        with self._lock:
+            self.posts.append((name, start, time.monotonic()))
+        return True, f"{name}: {caption}"
+
+    def post_to_instagram(self, media_path, caption="", is_video=False):
+        return self._post("instagram", media_path, caption)
+
+    def post_to_facebook(self, media_path, caption="", is_video=False):
+        return self._post("facebook", media_path, caption)
+
+    def post_media(self, media_path="", caption="", is_video=False, **kwargs):
+        return self._post("post_media", media_path, caption)
+
+    def get_posting_status(self):
+        return {"credentials_loaded": True}
+
+
+def make_handler(monkeypatch):
+    """Build a UnifiedPostingHandler whose platform handlers are all stubs."""
+    for class_name in HANDLER_CLASSES:
+        monkeypatch.setattr(posting_module, class_name, StubHandler)
+    return UnifiedPostingHandler()
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """UnifiedPostingHandler whose platform handlers are all stubs."""
+    return make_handler(monkeypatch)
+
+
+def test_platform_limits_are_read_only(handler):
+    limits = handler.get_platform_limits()
+
+    with pytest.raises(TypeError):
+        limits["instagram"] = {}
+    with pytest.raises(TypeError):
+        limits["instagram"]["max_caption_length"] = 1
+
+    assert handler.get_platform_limits()["instagram"]["max_caption_length"] == 2200
+    assert posting_module.PLATFORM_LIMITS["bluesky"]["max_caption_length"] == 300
+
+
+@pytest.fixture
+def unpaced_handler(handler):
+    """Handler without per-handler rate limiting, so only the grouping decides the timing."""
+    handler._rate_limiters = {}
+    return handler
+
+
+def overlaps(first, second):
+    """Whether two recorded (name, start, end) posts ran at the same time."""
+    return first[1] < second[2] and second[1] < first[2]
+
+
+def test_platforms_on_different_handlers_post_concurrently(unpaced_handler):
+    unpaced_handler.tiktok_handler.delay = 0.2
+    unpaced_handler.threads_handler.delay = 0.2
+
+    results = unpaced_handler.post_to_platforms(["tiktok", "threads"], "photo.jpg", "hello")
+
+    assert results == {"tiktok": (True, "post_media: hello"), "threads": (True, "post_media: hello")}
+    assert overlaps(unpaced_handler.tiktok_handler.posts[0], unpaced_handler.threads_handler.posts[0])
+
+
+def test_platforms_sharing_a_handler_post_one_after_another(unpaced_handler):
+    meta_handler = unpaced_handler.meta_handler
+    meta_handler.delay = 0.1
+
+    unpaced_handler.post_to_platforms(["instagram", "facebook"], "photo.jpg", "hello")
+
+    assert [post[0] for post in meta_handler.posts] == ["instagram", "facebook"]
+    assert not overlaps(meta_handler.posts[0], meta_handler.posts[1])
+
+
+def test_results_follow_the_callers_platform_order(unpaced_handler):
+    # The first platform finishes last, and Facebook waits behind Instagram on the shared handler
+    unpaced_handler.bluesky_handler.delay = 0.2
+    platforms = ["bluesky", "Instagram", "tiktok", "facebook", "threads"]
+
+    results = unpaced_handler.post_to_platforms(platforms, "photo.jpg", "hello")
+
+    assert list(results) == platforms
+
+
+def test_unsupported_platform_fails_without_affecting_the_others(unpaced_handler):
+    completed = []
+    unpaced_handler.signals.all_uploads_complete.connect(lambda success, results: completed.append(success))
+
+    results = unpaced_handler.post_to_platforms(["myspace", "tiktok"], "photo.jpg", "hello")
+
+    assert results == {
+        "myspace": (False, "Unsupported platform: myspace"),
+        "tiktok": (True, "post_media: hello"),
+    }
+    assert completed == [False]
+
+
+def test_failing_platform_is_reported_without_cancelling_the_others(unpaced_handler):
+    def broken(*args, **kwargs):
+        raise RuntimeError("upload rejected")
+
+    unpaced_handler.meta_handler.post_to_instagram = broken
+
+    results = unpaced_handler.post_to_platforms(["instagram", "facebook", "tiktok"], "photo.jpg", "hello")
+
+    assert results["instagram"] == (False, "Error posting to instagram: upload rejected")
+    assert results["facebook"] == (True, "facebook: hello")
+    assert results["tiktok"] == (True, "post_media: hello")
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping just advances the monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch the posting module's clock with a FakeClock."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(posting_module, "time", fake_clock)
+    return fake_clock
+
+
+def test_token_bucket_allows_a_burst_then_waits(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_refills_with_elapsed_time(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+    for _ in range(3):
+        bucket.acquire()
+
+    # Half a token has come back, so the next caller only waits for the other half
+    clock.now += 0.25
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_token_bucket_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3)
+    bucket.acquire()
+
+    clock.now += 60
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_concurrent_callers_queue_behind_each_other(clock):
+    bucket = TokenBucket(rate=4.0, capacity=1)
+    bucket.acquire()
+
+    # Callers arriving at the same instant: each one waits an interval longer than the last
+    clock.sleep = clock.sleeps.append
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+def test_posts_through_one_handler_from_two_threads_are_spaced_by_the_rate(monkeypatch):
+    monkeypatch.setattr(posting_module, "POST_RATE_PER_SECOND", 10.0)
+    handler = make_handler(monkeypatch)
+    barrier = threading.Barrier(2)
+
+    def post(platform):
+        barrier.wait()
+        handler._post_to_single_platform(platform, "photo.jpg", "hello", False)
+
+    threads = [threading.Thread(target=post, args=(platform,)) for platform in ("instagram", "facebook")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts = sorted(start for _, start, _ in handler.meta_handler.posts)
+    assert len(starts) == 2
+    assert starts[1] - starts[0] >= 1 / posting_module.POST_RATE_PER_SECOND - 0.01
+
+    # Another handler is not held back by Meta's pacing
+    start = time.monotonic()
+    handler._post_to_single_platform("tiktok", "photo.jpg", "hello", False)
+    assert time.monotonic() - start < 1 / posting_module.POST_RATE_PER_SECOND